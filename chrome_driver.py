@@ -0,0 +1,18 @@
+"""
+Chromedriver lookup shared by the browser bots
+"""
+
+import os
+
+_DRIVER_PATH = None
+
+
+def get_driver_path() -> str:
+    """Resolve the chromedriver binary once per process (or use CHROMEDRIVER_PATH)"""
+    global _DRIVER_PATH
+    if _DRIVER_PATH is None:
+        _DRIVER_PATH = os.environ.get('CHROMEDRIVER_PATH')
+        if not _DRIVER_PATH:
+            from webdriver_manager.chrome import ChromeDriverManager
+            _DRIVER_PATH = ChromeDriverManager().install()
+    return _DRIVER_PATH
@@ -63,6 +63,9 @@ LINKEDIN = {
     "password": os.getenv('LINKEDIN_PASSWORD', ''),
     "easy_apply_only": os.getenv('LINKEDIN_EASY_APPLY_ONLY', 'True').lower() == 'true',
     "max_applications_per_day": int(os.getenv('LINKEDIN_MAX_APPLICATIONS', 50)),
+    # Chrome profile kept between runs so the session survives restarts; only
+    # one Chrome can use it at a time, so leave unset with parallel workers
+    "profile_dir": os.getenv('LINKEDIN_PROFILE_DIR') or None,
 }
 
 # Indeed Configuration  
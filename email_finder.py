@@ -20,9 +20,13 @@ class EmailFinder:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
         }
+        self._emails = None  # find_emails() result, shared by the role lookups
     
     def find_emails(self) -> Dict[str, List[str]]:
-        """Find emails for key roles in the company"""
+        """Find emails for key roles in the company (scraped once per finder)"""
+        if self._emails is not None:
+            return self._emails
+        
         print(f"🔍 Searching for key contacts at {self.company_name}...")
         
         # Try different methods to find emails
@@ -44,7 +48,8 @@ class EmailFinder:
         # emails.update(self._check_linkedin())
         
         # Filter and validate emails
-        return self._filter_emails(emails)
+        self._emails = self._filter_emails(emails)
+        return self._emails
     
     def _check_common_patterns(self) -> Dict[str, List[str]]:
         """Check common email patterns for the company"""
@@ -164,6 +169,13 @@ class EmailFinder:
         print("⚠️ LinkedIn integration requires API access")
         return []
     
+    def find_all_contacts(self) -> Dict[str, Optional[Dict]]:
+        """Find the RHE and Site Manager contacts from a single scrape"""
+        return {
+            'rhe': self.find_rhe_contact(),
+            'site_manager': self.find_site_manager_contact()
+        }
+    
     def find_rhe_contact(self) -> Optional[Dict]:
         """Find RHE (Responsable Hygiène et Sécurité) contact"""
         emails = self.find_emails()
@@ -3,6 +3,8 @@ Email Notifier - Send job summaries via email
 """
 
 import smtplib
+import threading
+from contextlib import contextmanager
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
@@ -20,6 +22,80 @@ class EmailNotifier:
         self.smtp_password = smtp_password
         self.from_email = from_email
         self.from_name = from_name
+        # Connections opened inside session(), one per sending thread
+        self._session = None
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open an authenticated SMTP connection"""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        server.starttls()
+        server.login(self.smtp_username, self.smtp_password)
+        return server
+    
+    @contextmanager
+    def session(self):
+        """Reuse SMTP connections for every email sent inside the block
+        
+        Nothing is opened until the first send; each sending thread then keeps
+        its own connection, so concurrent senders don't wait on each other.
+        All of them are closed when the block exits.
+        """
+        self._session = {}
+        try:
+            yield
+        finally:
+            servers, self._session = list(self._session.values()), None
+            for server in servers:
+                try:
+                    server.quit()
+                except (smtplib.SMTPException, OSError):
+                    pass
+    
+    def _send_message(self, msg, smtp: smtplib.SMTP = None):
+        """Send over the given connection, this thread's session connection, or a new one"""
+        if smtp is not None:
+            smtp.send_message(msg)
+            return
+        
+        session = self._session
+        if session is None:
+            with self._connect() as server:
+                server.send_message(msg)
+            return
+        
+        thread_id = threading.get_ident()
+        server = session.get(thread_id)
+        if server is not None:
+            try:
+                server.send_message(msg)
+                return
+            except smtplib.SMTPServerDisconnected:
+                pass  # Server dropped the idle connection; reconnect below
+        
+        server = session[thread_id] = self._connect()
+        server.send_message(msg)
+    
+    def send_email(self, to_email: str, subject: str, message: str,
+                   is_html: bool = False, smtp: smtplib.SMTP = None) -> bool:
+        """Send a single email
+        
+        Args:
+            to_email: Recipient email address
+            subject: Email subject
+            message: Email body
+            is_html: Whether the body is HTML rather than plain text
+            smtp: Live connection to send over (defaults to the open session)
+        
+        Returns:
+            True once sent; SMTP and socket errors propagate to the caller
+        """
+        msg = MIMEText(message, 'html' if is_html else 'plain')
+        msg['Subject'] = subject
+        msg['From'] = f"{self.from_name} <{self.from_email}>"
+        msg['To'] = to_email
+        
+        self._send_message(msg, smtp)
+        return True
         
     def send_job_summary(self, recipient_email: str, jobs: List[Dict], 
                         stats: Dict = None) -> bool:
@@ -38,10 +114,7 @@ class EmailNotifier:
             msg.attach(MIMEText(html_content, 'html'))
             
             # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
+            self._send_message(msg)
             
             print(f"✅ Email sent to {recipient_email}")
             return True
@@ -205,10 +278,7 @@ Good luck! 🍀
             
             msg.attach(MIMEText(body, 'plain'))
             
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
+            self._send_message(msg)
             
             return True
             
@@ -245,10 +315,7 @@ Good luck! 🍀
             msg.attach(MIMEText(template['body'], 'plain'))
             
             # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
+            self._send_message(msg)
             
             print(f"✅ Templated email sent to {to_email}")
             return True
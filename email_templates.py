@@ -4,6 +4,115 @@ Email Templates - Predefined email templates for different response types
 
 from typing import Dict, Optional
 from datetime import datetime
+from functools import lru_cache
+
+# Template bodies, filled in with str.format
+_INTERVIEW_REQUEST_BODY = """Bonjour {contact_name},
+
+Je vous remercie pour votre retour concernant ma candidature pour le poste de {job_title}.
+
+Je suis disponible pour un entretien aux créneaux suivants :
+- {available_slot_1}
+- {available_slot_2}
+
+N'hésitez pas à me proposer d'autres créneaux si ceux-ci ne vous conviennent pas.
+
+Je reste à votre disposition pour tout complément d'information.
+
+Cordialement,
+{first_name} {last_name}
+{phone}
+{email}
+"""
+
+_FOLLOW_UP_BODY = """Bonjour {contact_name},
+
+Je me permets de faire un suivi concernant ma candidature pour le poste de {job_title} que j'ai soumise le {application_date}.
+
+Je reste très intéressé(e) par cette opportunité et je me tenais à votre disposition pour toute information complémentaire concernant mon profil ou pour programmer un entretien.
+
+Je vous remercie par avance pour le temps que vous accorderez à ma demande et vous prie d'agréer, {contact_title}, mes salutations distinguées.
+
+{first_name} {last_name}
+{phone}
+{email}
+"""
+
+_INFORMATION_REQUEST_BODY = """Bonjour {contact_name},
+
+Je vous remercie pour votre retour concernant ma candidature pour le poste de {job_title}.
+
+Comme demandé, je me permets de vous transmettre les informations complémentaires suivantes :
+
+{additional_info}
+
+Je reste à votre disposition pour tout complément d'information ou pour échanger plus en détail sur cette opportunité.
+
+Cordialement,
+{first_name} {last_name}
+{phone}
+{email}
+"""
+
+_THANK_YOU_BODY = """Bonjour {contact_name},
+
+Je tenais à vous remercier pour l'entretien que j'ai eu {interview_date} concernant le poste de {job_title}.
+
+J'ai particulièrement apprécié notre échange et les informations que vous m'avez transmises sur {company_name} et les missions du poste. Cette opportunité correspond parfaitement à mes aspirations professionnelles et à mes compétences en {key_skill_1} et {key_skill_2}.
+
+Je réitère tout mon vif intérêt pour ce poste et reste à votre entière disposition pour tout complément d'information.
+
+Je vous remercie à nouveau pour votre accueil et votre confiance, et je reste dans l'attente de votre retour.
+
+Bien cordialement,
+{first_name} {last_name}
+{phone}
+{email}
+"""
+
+_STATUS_UPDATE_BODY = """Bonjour {contact_name},
+
+Je me permets de vous contacter concernant l'état d'avancement du processus de recrutement pour le poste de {job_title} pour lequel j'ai postulé le {application_date}.
+
+Je reste très intéressé(e) par cette opportunité et j'aimerais savoir s'il y a eu des évolutions récentes concernant ma candidature.
+
+Je vous remercie par avance pour votre retour et reste à votre disposition pour tout complément d'information.
+
+Cordialement,
+{first_name} {last_name}
+{phone}
+{email}
+"""
+
+_WITHDRAWAL_BODY = """Bonjour {contact_name},
+
+Je vous écris pour vous informer que je souhaite retirer ma candidature pour le poste de {job_title}.
+
+{reason}
+
+Je tiens à vous remercier pour le temps que vous avez accordé à l'examen de mon dossier et pour l'opportunité qui m'a été donnée de postuler à ce poste.
+
+Je vous prie d'agréer, {contact_title}, mes salutations distinguées.
+
+{first_name} {last_name}
+{email}
+"""
+
+_REJECTION_RESPONSE_BODY = """Bonjour {contact_name},
+
+Je vous remercie d'avoir pris le temps d'examiner ma candidature pour le poste de {job_title}.
+
+Bien que déçu(e) de ne pas être retenu(e) pour ce poste, je tiens à vous remercier pour l'opportunité qui m'a été donnée de postuler et pour la qualité des échanges que nous avons eus.
+
+{feedback_request}
+
+Je reste intéressé(e) par les opportunités futures au sein de {company_name} et vous remercie à nouveau pour votre considération.
+
+Cordialement,
+{first_name} {last_name}
+{email}
+"""
+
 
 class EmailTemplates:
     """Collection of email templates for different response types"""
@@ -20,34 +129,24 @@ class EmailTemplates:
         Returns:
             Dict with 'subject' and 'body' keys
         """
+        return EmailTemplates._template_method(template_name)(context)
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _template_method(template_name: str):
+        """Resolve a template name to its method once"""
         template_method = getattr(EmailTemplates, f"_{template_name}", None)
         if not template_method or not callable(template_method):
             raise ValueError(f"Template '{template_name}' not found")
-            
-        return template_method(context)
+        
+        return template_method
     
     @staticmethod
     def _interview_request(context: Dict) -> Dict[str, str]:
         """Template for responding to interview requests"""
         subject = f"Disponibilités pour entretien - {context.get('job_title', 'Candidature')}"
         
-        body = f"""Bonjour {contact_name},
-
-Je vous remercie pour votre retour concernant ma candidature pour le poste de {job_title}.
-
-Je suis disponible pour un entretien aux créneaux suivants :
-- {available_slot_1}
-- {available_slot_2}
-
-N'hésitez pas à me proposer d'autres créneaux si ceux-ci ne vous conviennent pas.
-
-Je reste à votre disposition pour tout complément d'information.
-
-Cordialement,
-{first_name} {last_name}
-{phone}
-{email}
-""".format(
+        body = _INTERVIEW_REQUEST_BODY.format(
             contact_name=context.get('contact_name', ''),
             job_title=context.get('job_title', ''),
             available_slot_1=context.get('available_slots', ['', ''])[0],
@@ -65,18 +164,7 @@ Cordialement,
         """Template for follow-up emails"""
         subject = f"Suite à ma candidature - {context.get('job_title', 'Poste')}"
         
-        body = f"""Bonjour {contact_name},
-
-Je me permets de faire un suivi concernant ma candidature pour le poste de {job_title} que j'ai soumise le {application_date}.
-
-Je reste très intéressé(e) par cette opportunité et je me tenais à votre disposition pour toute information complémentaire concernant mon profil ou pour programmer un entretien.
-
-Je vous remercie par avance pour le temps que vous accorderez à ma demande et vous prie d'agréer, {contact_title}, mes salutations distinguées.
-
-{first_name} {last_name}
-{phone}
-{email}
-""".format(
+        body = _FOLLOW_UP_BODY.format(
             contact_name=context.get('contact_name', ''),
             contact_title='Madame, Monsieur' if not context.get('contact_name') else '',
             job_title=context.get('job_title', ''),
@@ -94,21 +182,7 @@ Je vous remercie par avance pour le temps que vous accorderez à ma demande et v
         """Template for responding to information requests"""
         subject = f"Informations complémentaires - {context.get('job_title', 'Candidature')}"
         
-        body = f"""Bonjour {contact_name},
-
-Je vous remercie pour votre retour concernant ma candidature pour le poste de {job_title}.
-
-Comme demandé, je me permets de vous transmettre les informations complémentaires suivantes :
-
-{additional_info}
-
-Je reste à votre disposition pour tout complément d'information ou pour échanger plus en détail sur cette opportunité.
-
-Cordialement,
-{first_name} {last_name}
-{phone}
-{email}
-""".format(
+        body = _INFORMATION_REQUEST_BODY.format(
             contact_name=context.get('contact_name', ''),
             job_title=context.get('job_title', ''),
             additional_info=context.get('additional_info', ''),
@@ -125,21 +199,7 @@ Cordialement,
         """Template for thank you emails after interviews"""
         subject = f"Remerciements - Entretien du {context.get('interview_date', '')} - {context.get('job_title', '')}"
         
-        body = f"""Bonjour {contact_name},
-
-Je tenais à vous remercier pour l'entretien que j'ai eu {interview_date} concernant le poste de {job_title}.
-
-J'ai particulièrement apprécié notre échange et les informations que vous m'avez transmises sur {company_name} et les missions du poste. Cette opportunité correspond parfaitement à mes aspirations professionnelles et à mes compétences en {key_skill_1} et {key_skill_2}.
-
-Je réitère tout mon vif intérêt pour ce poste et reste à votre entière disposition pour tout complément d'information.
-
-Je vous remercie à nouveau pour votre accueil et votre confiance, et je reste dans l'attente de votre retour.
-
-Bien cordialement,
-{first_name} {last_name}
-{phone}
-{email}
-""".format(
+        body = _THANK_YOU_BODY.format(
             contact_name=context.get('contact_name', ''),
             interview_date=context.get('interview_date', ''),
             job_title=context.get('job_title', ''),
@@ -159,19 +219,7 @@ Bien cordialement,
         """Template for status update requests"""
         subject = f"Demande de mise à jour - Candidature {context.get('job_title', '')}"
         
-        body = f"""Bonjour {contact_name},
-
-Je me permets de vous contacter concernant l'état d'avancement du processus de recrutement pour le poste de {job_title} pour lequel j'ai postulé le {application_date}.
-
-Je reste très intéressé(e) par cette opportunité et j'aimerais savoir s'il y a eu des évolutions récentes concernant ma candidature.
-
-Je vous remercie par avance pour votre retour et reste à votre disposition pour tout complément d'information.
-
-Cordialement,
-{first_name} {last_name}
-{phone}
-{email}
-""".format(
+        body = _STATUS_UPDATE_BODY.format(
             contact_name=context.get('contact_name', ''),
             job_title=context.get('job_title', ''),
             application_date=context.get('application_date', datetime.now().strftime('%d/%m/%Y')),
@@ -188,19 +236,7 @@ Cordialement,
         """Template for withdrawing an application"""
         subject = f"Retrait de candidature - {context.get('job_title', '')}"
         
-        body = f"""Bonjour {contact_name},
-
-Je vous écris pour vous informer que je souhaite retirer ma candidature pour le poste de {job_title}.
-
-{reason}
-
-Je tiens à vous remercier pour le temps que vous avez accordé à l'examen de mon dossier et pour l'opportunité qui m'a été donnée de postuler à ce poste.
-
-Je vous prie d'agréer, {contact_title}, mes salutations distinguées.
-
-{first_name} {last_name}
-{email}
-""".format(
+        body = _WITHDRAWAL_BODY.format(
             contact_name=context.get('contact_name', ''),
             contact_title='Madame, Monsieur' if not context.get('contact_name') else '',
             job_title=context.get('job_title', ''),
@@ -217,20 +253,7 @@ Je vous prie d'agréer, {contact_title}, mes salutations distinguées.
         """Template for responding to rejection emails"""
         subject = f"Suite à votre retour - Candidature {context.get('job_title', '')}"
         
-        body = f"""Bonjour {contact_name},
-
-Je vous remercie d'avoir pris le temps d'examiner ma candidature pour le poste de {job_title}.
-
-Bien que déçu(e) de ne pas être retenu(e) pour ce poste, je tiens à vous remercier pour l'opportunité qui m'a été donnée de postuler et pour la qualité des échanges que nous avons eus.
-
-{feedback_request}
-
-Je reste intéressé(e) par les opportunités futures au sein de {company_name} et vous remercie à nouveau pour votre considération.
-
-Cordialement,
-{first_name} {last_name}
-{email}
-""".format(
+        body = _REJECTION_RESPONSE_BODY.format(
             contact_name=context.get('contact_name', ''),
             job_title=context.get('job_title', ''),
             feedback_request=context.get('feedback_request', 'Je serais très intéressé(e) par un retour sur ma candidature qui me permettrait d\'améliorer mes futures démarches.') if context.get('request_feedback', True) else '',
@@ -12,10 +12,32 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from bs4 import BeautifulSoup
 import requests
 
+from chrome_driver import get_driver_path
+
 
 class GlassdoorBot:
     """Scrape jobs from Glassdoor with company ratings"""
     
+    # Scrolls to the bottom every 500ms and resolves once scrollHeight
+    # has been stable for two consecutive ticks, or after maxTicks ticks so
+    # an endless feed never leaves the timer running
+    SCROLL_UNTIL_STABLE_JS = """
+        const [maxTicks, done] = arguments;
+        let last = 0, stable = 0, ticks = 0;
+        const timer = setInterval(() => {
+            window.scrollTo(0, document.body.scrollHeight);
+            const height = document.body.scrollHeight;
+            if (height === last) {
+                stable++;
+            } else {
+                last = height;
+                stable = 0;
+            }
+            if (stable >= 2 || ++ticks >= maxTicks) { clearInterval(timer); done(); }
+        }, 500);
+    """
+    SCROLL_MAX_TICKS = 16
+    
     def __init__(self, headless: bool = True):
         """
         Initialize Glassdoor bot
@@ -33,7 +55,6 @@ class GlassdoorBot:
             return
         
         from selenium.webdriver.chrome.options import Options
-        from webdriver_manager.chrome import ChromeDriverManager
         from selenium.webdriver.chrome.service import Service
         
         options = Options()
@@ -43,7 +64,7 @@ class GlassdoorBot:
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
         
-        service = Service(ChromeDriverManager().install())
+        service = Service(get_driver_path())
         self.driver = webdriver.Chrome(service=service, options=options)
     
     def search_jobs(self, keywords: str, location: str, 
@@ -79,10 +100,16 @@ class GlassdoorBot:
             except:
                 pass
             
-            # Scroll to load more jobs
-            for _ in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            # Scroll until the page height stops growing (single round trip);
+            # the script gives up after SCROLL_MAX_TICKS, inside the timeout
+            previous_timeout = self.driver.timeouts.script
+            self.driver.set_script_timeout(10)
+            try:
+                self.driver.execute_async_script(self.SCROLL_UNTIL_STABLE_JS, self.SCROLL_MAX_TICKS)
+            except TimeoutException:
+                pass
+            finally:
+                self.driver.set_script_timeout(previous_timeout)
             
             # Extract job listings
             job_cards = self.driver.find_elements(By.CSS_SELECTOR, 'li[data-test="jobListing"]')
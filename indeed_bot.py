@@ -7,6 +7,8 @@ import time
 import random
 import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import Tuple, List, Dict, Optional
 from urllib.parse import quote_plus
@@ -18,9 +20,11 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 
+from chrome_driver import get_driver_path
+
+
 class IndeedBot:
     def __init__(self, headless: bool = False):
         self.driver = None
@@ -31,6 +35,13 @@ class IndeedBot:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
         })
+        # Parallel keyword searches share this session, so size the pool for them
+        adapter = HTTPAdapter(
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
     def setup_driver(self):
         """Setup Chrome driver for applications"""
@@ -46,7 +57,7 @@ class IndeedBot:
         options.add_argument('--start-maximized')
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        self.driver = webdriver.Chrome(service=Service(get_driver_path()), options=options)
         
     def random_delay(self, min_sec: float = 1, max_sec: float = 3):
         """Add random delay"""
@@ -149,7 +160,7 @@ class IndeedBot:
                 if link and 'jk=' in link['href']:
                     job_id = link['href'].split('jk=')[-1].split('&')[0]
                 else:
-                    job_id = hashlib.md5(str(card)[:100].encode()).hexdigest()[:12]
+                    job_id = hashlib.blake2b(str(card)[:100].encode(), digest_size=6).hexdigest()
             
             # Title
             title_elem = card.find('h2', class_='jobTitle') or card.find('a', {'data-jk': True})
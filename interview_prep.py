@@ -3,82 +3,239 @@ Interview Preparation Assistant - Comprehensive interview prep system
 """
 
 import os
+import re
+import asyncio
+import hashlib
+import threading
+from collections import ChainMap, OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Optional
+from urllib.parse import quote_plus
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import openai
+except ImportError:
+    openai = None
+
+# C-based lxml is far faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Company pages are only mined for their title and meta description
+SUMMARY_TAGS = SoupStrainer(['title', 'meta'])
+
+WORD_RE = re.compile(r'\w+')
+
+# AI answers keyed by a hash of the prompt, shared by all instances;
+# least recently used answers are dropped past AI_ANSWER_CACHE_SIZE
+AI_ANSWER_CACHE_SIZE = 128
+_AI_ANSWER_CACHE: 'OrderedDict[str, str]' = OrderedDict()
+_AI_ANSWER_LOCK = threading.Lock()
+
+# Common interview questions by category
+QUESTION_BANK = {
+    'behavioral': [
+        "Tell me about yourself",
+        "What are your greatest strengths?",
+        "What are your weaknesses?",
+        "Why do you want to work here?",
+        "Where do you see yourself in 5 years?",
+        "Tell me about a time you faced a challenge",
+        "Describe a time you showed leadership",
+        "How do you handle conflict?",
+        "What motivates you?",
+        "Why are you leaving your current job?"
+    ],
+    'technical': [
+        "Explain your most complex project",
+        "How do you approach problem-solving?",
+        "What's your development process?",
+        "How do you ensure code quality?",
+        "Describe your experience with [technology]",
+        "How do you stay updated with technology?",
+        "Walk me through your technical decision-making",
+        "How do you handle technical debt?",
+        "Explain a technical challenge you overcame",
+        "What's your testing strategy?"
+    ],
+    'situational': [
+        "How would you handle a tight deadline?",
+        "What would you do if you disagreed with your manager?",
+        "How do you prioritize tasks?",
+        "How would you handle an underperforming team member?",
+        "What would you do if you made a mistake?",
+        "How do you handle multiple priorities?",
+        "How would you approach learning a new technology?",
+        "What would you do if a project was failing?",
+        "How do you handle feedback?",
+        "How would you deal with a difficult stakeholder?"
+    ],
+    'company_specific': [
+        "Why do you want to work at [Company]?",
+        "What do you know about our company?",
+        "How would you contribute to our team?",
+        "What interests you about this role?",
+        "How do your values align with ours?",
+        "What do you think about our products/services?",
+        "How would you improve our [product/service]?",
+        "What challenges do you think we face?",
+        "Why should we hire you?",
+        "What questions do you have for us?"
+    ]
+}
+
+
+GENERAL_TIPS = (
+    "Research the company thoroughly before the interview",
+    "Prepare 2-3 examples for each common question using STAR method",
+    "Dress professionally and arrive 10 minutes early",
+    "Bring copies of your resume and a notepad",
+    "Practice your answers out loud beforehand",
+    "Prepare thoughtful questions to ask the interviewer",
+    "Follow up with a thank-you email within 24 hours",
+    "Be ready to discuss your salary expectations",
+    "Show enthusiasm and genuine interest in the role",
+    "Turn off your phone before the interview"
+)
+
+TECHNICAL_TIPS = (
+    "Be prepared for technical questions or coding challenges",
+    "Review fundamental concepts in your tech stack",
+    "Bring a portfolio or examples of your work"
+)
+
+
+# The builders below are pure functions of (role type, title, company), so
+# they're memoized and return tuples; callers copy into fresh lists/dicts.
+
+@lru_cache(maxsize=512)
+def _relevant_questions_for(role_type: str, title: str) -> tuple:
+    questions = [
+        (category, tuple(QUESTION_BANK[category][:5]))
+        for category in ('behavioral', 'technical', 'situational', 'company_specific')
+    ]
+    
+    # Add role-specific questions
+    if role_type == 'technical':
+        questions.append(('role_specific', (
+            f"Explain your experience with {title}",
+            "What's your approach to code reviews?",
+            "How do you handle production issues?",
+            "Describe your ideal development environment"
+        )))
+    elif role_type == 'management':
+        questions.append(('role_specific', (
+            "What's your management style?",
+            "How do you motivate your team?",
+            "How do you handle performance issues?",
+            "Describe a successful project you led"
+        )))
+    
+    return tuple(questions)
+
+
+@lru_cache(maxsize=512)
+def _interview_tips_for(role_type: str) -> tuple:
+    if role_type == 'technical':
+        return GENERAL_TIPS + TECHNICAL_TIPS
+    return GENERAL_TIPS
+
+
+@lru_cache(maxsize=512)
+def _questions_to_ask_for(company: str, title: str) -> tuple:
+    return (
+        f"What does success look like in this {title} after 6 months?",
+        "What are the biggest challenges facing the team right now?",
+        "How does this role contribute to the company's goals?",
+        "What's the team structure and who would I be working with?",
+        "What opportunities are there for professional development?",
+        f"What do you enjoy most about working at {company}?",
+        "What's the onboarding process like?",
+        "How do you measure performance in this role?",
+        "What's the company culture like?",
+        "What are the next steps in the interview process?"
+    )
 
 
 class InterviewPrep:
     """Prepare for job interviews with company research and practice questions"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    # Title words used by _classify_role
+    TECH_WORDS = frozenset({'developer', 'engineer', 'programmer'})
+    MGMT_WORDS = frozenset({'manager', 'director', 'lead'})
+    ANALYTICAL_WORDS = frozenset({'analyst', 'scientist'})
+    
+    # Fallback answers used when no AI client is configured
+    TELL_ME_TMPL = (
+        "I'm a {current_role} with {years_experience} years of experience in {field}. "
+        "I specialize in {skills} and have a track record of {achievements}."
+    )
+    TELL_ME_DEFAULTS = {
+        'current_role': 'professional',
+        'years_experience': 'several',
+        'field': 'the industry',
+        'skills': 'various areas',
+        'achievements': 'success',
+    }
+    WHY_ROLE_TMPL = (
+        "I'm excited about this {job_title} because it aligns perfectly with my skills in {skills} "
+        "and offers the opportunity to {career_goal}."
+    )
+    WHY_ROLE_DEFAULTS = {
+        'skills': 'key areas',
+        'career_goal': 'grow and contribute',
+    }
+    TEMPLATE_ANSWERS = (
+        ("Tell me about yourself", TELL_ME_TMPL, TELL_ME_DEFAULTS),
+        ("Why do you want this role?", WHY_ROLE_TMPL, WHY_ROLE_DEFAULTS),
+    )
+    
+    def __init__(self, api_key: Optional[str] = None, research_online: Optional[bool] = None):
         """
         Initialize interview prep assistant
         
         Args:
             api_key: OpenAI API key for AI-generated answers
+            research_online: Fetch the company's pages while researching it
+                (defaults to the INTERVIEW_RESEARCH_ONLINE env var, off)
         """
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         self.client = None
+        if research_online is None:
+            research_online = os.getenv('INTERVIEW_RESEARCH_ONLINE', 'false').lower() == 'true'
+        self.research_online = research_online
         
-        if self.api_key:
-            try:
-                import openai
-                self.client = openai.OpenAI(api_key=self.api_key)
-            except ImportError:
-                pass
+        # One pooled session for all company lookups (keeps TCP/TLS alive)
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept-Language': 'en-US,en;q=0.5',
+        })
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        if openai and self.api_key:
+            self.client = openai.OpenAI(api_key=self.api_key)
         
         # Common interview questions by category
-        self.question_bank = {
-            'behavioral': [
-                "Tell me about yourself",
-                "What are your greatest strengths?",
-                "What are your weaknesses?",
-                "Why do you want to work here?",
-                "Where do you see yourself in 5 years?",
-                "Tell me about a time you faced a challenge",
-                "Describe a time you showed leadership",
-                "How do you handle conflict?",
-                "What motivates you?",
-                "Why are you leaving your current job?"
-            ],
-            'technical': [
-                "Explain your most complex project",
-                "How do you approach problem-solving?",
-                "What's your development process?",
-                "How do you ensure code quality?",
-                "Describe your experience with [technology]",
-                "How do you stay updated with technology?",
-                "Walk me through your technical decision-making",
-                "How do you handle technical debt?",
-                "Explain a technical challenge you overcame",
-                "What's your testing strategy?"
-            ],
-            'situational': [
-                "How would you handle a tight deadline?",
-                "What would you do if you disagreed with your manager?",
-                "How do you prioritize tasks?",
-                "How would you handle an underperforming team member?",
-                "What would you do if you made a mistake?",
-                "How do you handle multiple priorities?",
-                "How would you approach learning a new technology?",
-                "What would you do if a project was failing?",
-                "How do you handle feedback?",
-                "How would you deal with a difficult stakeholder?"
-            ],
-            'company_specific': [
-                "Why do you want to work at [Company]?",
-                "What do you know about our company?",
-                "How would you contribute to our team?",
-                "What interests you about this role?",
-                "How do your values align with ours?",
-                "What do you think about our products/services?",
-                "How would you improve our [product/service]?",
-                "What challenges do you think we face?",
-                "Why should we hire you?",
-                "What questions do you have for us?"
-            ]
-        }
+        self.question_bank = QUESTION_BANK
     
     def prepare_for_interview(self, job: Dict, company: str, profile: Dict) -> Dict:
         """
@@ -125,85 +282,124 @@ class InterviewPrep:
             'leadership': "Key executives and leadership team"
         }
         
-        # Try to scrape basic info (simplified)
-        try:
-            # This is a placeholder - real implementation would scrape company website
-            research['scraped_info'] = f"Visit {company}'s website for detailed information"
-        except Exception as e:
-            research['error'] = str(e)
+        research['scraped_info'] = f"Visit {company}'s website for detailed information"
+        if not self.research_online:
+            return research
+        
+        # Scrape basic info from all sources concurrently
+        for key, html in self._fetch_company_pages(company).items():
+            summary = self._summarize_page(key, html)
+            if summary:
+                research[key] = summary
         
         return research
     
-    def _get_relevant_questions(self, job: Dict) -> Dict:
-        """Get questions relevant to the job role"""
-        role_type = self._classify_role(job.get('title', ''))
-        
-        questions = {
-            'behavioral': self.question_bank['behavioral'][:5],
-            'technical': self.question_bank['technical'][:5],
-            'situational': self.question_bank['situational'][:5],
-            'company_specific': self.question_bank['company_specific'][:5]
+    def _company_sources(self, company: str) -> Dict[str, str]:
+        """Map research keys to the URLs they are scraped from"""
+        slug = re.sub(r'[^a-z0-9]', '', company.lower())
+        return {
+            'scraped_info': f"https://www.{slug}.com",
+            'linkedin': f"https://www.linkedin.com/company/{slug}/",
+            'recent_news': f"https://news.google.com/rss/search?q={quote_plus(company)}",
         }
+    
+    def _fetch_company_pages(self, company: str) -> Dict[str, str]:
+        """Fetch every company source, returning {research_key: html} for successes"""
+        sources = self._company_sources(company)
+        
+        # Fan out with aiohttp unless we're already inside an event loop
+        if aiohttp and not self._in_event_loop():
+            return asyncio.run(self._research_company_async(sources))
+        
+        pages = {}
+        for key, url in sources.items():
+            try:
+                response = self.session.get(url, timeout=(3, 10))
+                response.raise_for_status()
+                pages[key] = response.text
+            except requests.RequestException:
+                continue
+        return pages
+    
+    async def _research_company_async(self, sources: Dict[str, str]) -> Dict[str, str]:
+        """Fetch all sources in parallel over one aiohttp session"""
+        connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=10, connect=3)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=dict(self.session.headers)) as session:
+            results = await asyncio.gather(
+                *[self._fetch(session, url) for url in sources.values()],
+                return_exceptions=True
+            )
+        
+        return {key: html for key, html in zip(sources, results) if isinstance(html, str)}
+    
+    @staticmethod
+    def _in_event_loop() -> bool:
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+    
+    @staticmethod
+    async def _fetch(session, url: str) -> str:
+        """GET a URL and return its body text"""
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return await response.text()
+    
+    def _summarize_page(self, key: str, html: str) -> str:
+        """Pull a one-line summary out of a fetched page"""
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=SUMMARY_TAGS)
         
-        # Add role-specific questions
-        if role_type == 'technical':
-            questions['role_specific'] = [
-                f"Explain your experience with {job.get('title', 'this role')}",
-                "What's your approach to code reviews?",
-                "How do you handle production issues?",
-                "Describe your ideal development environment"
-            ]
-        elif role_type == 'management':
-            questions['role_specific'] = [
-                "What's your management style?",
-                "How do you motivate your team?",
-                "How do you handle performance issues?",
-                "Describe a successful project you led"
-            ]
+        if key == 'recent_news':
+            # RSS feed: first <title> is the feed itself, the rest are headlines
+            headlines = [t.get_text(strip=True) for t in soup.find_all('title')[1:4]]
+            return ' | '.join(h for h in headlines if h)
         
-        return questions
+        meta = soup.find('meta', attrs={'name': 'description'})
+        if meta and meta.get('content'):
+            return meta['content'].strip()
+        if soup.title:
+            return soup.title.get_text(strip=True)
+        return ''
+    
+    def _get_relevant_questions(self, job: Dict) -> Dict:
+        """Get questions relevant to the job role"""
+        role_type = self._classify_role(job.get('title', ''))
+        cached = _relevant_questions_for(role_type, job.get('title', 'this role'))
+        return {category: list(questions) for category, questions in cached}
     
     def _classify_role(self, title: str) -> str:
         """Classify role type from title"""
-        title_lower = title.lower()
+        tokens = set(WORD_RE.findall(title.lower()))
         
-        if any(word in title_lower for word in ['developer', 'engineer', 'programmer']):
+        if tokens & self.TECH_WORDS:
             return 'technical'
-        elif any(word in title_lower for word in ['manager', 'director', 'lead']):
+        elif tokens & self.MGMT_WORDS:
             return 'management'
-        elif any(word in title_lower for word in ['analyst', 'scientist']):
+        elif tokens & self.ANALYTICAL_WORDS:
             return 'analytical'
         else:
             return 'general'
     
     def _generate_answers(self, job: Dict, profile: Dict) -> List[Dict]:
         """Generate suggested answers using STAR method"""
-        answers = []
-        
-        # Example STAR answer template
-        star_template = {
-            'question': "Tell me about a time you faced a challenge",
-            'situation': f"In my role as {profile.get('current_role', 'professional')}...",
-            'task': "I was responsible for...",
-            'action': "I took the following steps...",
-            'result': "As a result, we achieved..."
-        }
-        
         if self.client:
             # Use AI to generate personalized answers
-            answers = self._generate_ai_answers(job, profile)
-        else:
-            # Use template answers
-            answers = [
-                {
-                    'question': "Tell me about yourself",
-                    'answer': f"I'm a {profile.get('current_role', 'professional')} with {profile.get('years_experience', 'several')} years of experience in {profile.get('field', 'the industry')}. I specialize in {profile.get('skills', 'various areas')} and have a track record of {profile.get('achievements', 'success')}."
-                },
-                {
-                    'question': "Why do you want this role?",
-                    'answer': f"I'm excited about this {job.get('title', 'position')} because it aligns perfectly with my skills in {profile.get('skills', 'key areas')} and offers the opportunity to {profile.get('career_goal', 'grow and contribute')}."
-                }
-            ]
+            return self._generate_ai_answers(job, profile)
+        
+        # Use template answers, filling gaps in the profile from per-template defaults
+        job_fields = {'job_title': job.get('title', 'position')}
+        answers = [
+            {
+                'question': question,
+                'answer': template.format_map(ChainMap(job_fields, profile, defaults))
+            }
+            for question, template, defaults in self.TEMPLATE_ANSWERS
+        ]
         
         return answers
     
@@ -225,33 +421,34 @@ Questions:
 
 Format each answer with Situation, Task, Action, Result."""
 
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7
-            )
+            # Identical prompts (same job/profile) are answered from cache
+            key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+            with _AI_ANSWER_LOCK:
+                answer = _AI_ANSWER_CACHE.get(key)
+                if answer is not None:
+                    _AI_ANSWER_CACHE.move_to_end(key)
+            
+            if answer is None:
+                # The lock is not held over the API call
+                response = self.client.chat.completions.create(
+                    model="gpt-4",
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.7
+                )
+                answer = response.choices[0].message.content
+                with _AI_ANSWER_LOCK:
+                    _AI_ANSWER_CACHE[key] = answer
+                    if len(_AI_ANSWER_CACHE) > AI_ANSWER_CACHE_SIZE:
+                        _AI_ANSWER_CACHE.popitem(last=False)
             
             # Parse response (simplified)
-            return [{'answer': response.choices[0].message.content}]
+            return [{'answer': answer}]
         except:
             return []
     
     def _suggest_questions_to_ask(self, company: str, job: Dict) -> List[str]:
         """Suggest intelligent questions to ask the interviewer"""
-        questions = [
-            f"What does success look like in this {job.get('title', 'role')} after 6 months?",
-            "What are the biggest challenges facing the team right now?",
-            "How does this role contribute to the company's goals?",
-            "What's the team structure and who would I be working with?",
-            "What opportunities are there for professional development?",
-            f"What do you enjoy most about working at {company}?",
-            "What's the onboarding process like?",
-            "How do you measure performance in this role?",
-            "What's the company culture like?",
-            "What are the next steps in the interview process?"
-        ]
-        
-        return questions
+        return list(_questions_to_ask_for(company, job.get('title', 'role')))
     
     def _get_salary_range(self, job: Dict) -> Dict:
         """Get salary range for the position"""
@@ -263,29 +460,7 @@ Format each answer with Situation, Task, Action, Result."""
     
     def _get_interview_tips(self, job: Dict) -> List[str]:
         """Get interview tips specific to the role"""
-        tips = [
-            "Research the company thoroughly before the interview",
-            "Prepare 2-3 examples for each common question using STAR method",
-            "Dress professionally and arrive 10 minutes early",
-            "Bring copies of your resume and a notepad",
-            "Practice your answers out loud beforehand",
-            "Prepare thoughtful questions to ask the interviewer",
-            "Follow up with a thank-you email within 24 hours",
-            "Be ready to discuss your salary expectations",
-            "Show enthusiasm and genuine interest in the role",
-            "Turn off your phone before the interview"
-        ]
-        
-        role_type = self._classify_role(job.get('title', ''))
-        
-        if role_type == 'technical':
-            tips.extend([
-                "Be prepared for technical questions or coding challenges",
-                "Review fundamental concepts in your tech stack",
-                "Bring a portfolio or examples of your work"
-            ])
-        
-        return tips
+        return list(_interview_tips_for(self._classify_role(job.get('title', ''))))
     
     def _create_follow_up_template(self, job: Dict, company: str) -> str:
         """Create thank-you email template"""
@@ -316,28 +491,24 @@ Best regards,
         # Company Research
         report.append("\n📊 COMPANY RESEARCH")
         report.append("-" * 70)
-        for key, value in prep_package['company_research'].items():
-            report.append(f"  {key.title()}: {value}")
+        report.extend(f"  {key.title()}: {value}" for key, value in prep_package['company_research'].items())
         
         # Common Questions
         report.append("\n❓ COMMON INTERVIEW QUESTIONS")
         report.append("-" * 70)
         for category, questions in prep_package['common_questions'].items():
             report.append(f"\n  {category.upper().replace('_', ' ')}:")
-            for i, q in enumerate(questions, 1):
-                report.append(f"    {i}. {q}")
+            report.extend(f"    {i}. {q}" for i, q in enumerate(questions, 1))
         
         # Questions to Ask
         report.append("\n🤔 QUESTIONS TO ASK THE INTERVIEWER")
         report.append("-" * 70)
-        for i, q in enumerate(prep_package['questions_to_ask'], 1):
-            report.append(f"  {i}. {q}")
+        report.extend(f"  {i}. {q}" for i, q in enumerate(prep_package['questions_to_ask'], 1))
         
         # Interview Tips
         report.append("\n💡 INTERVIEW TIPS")
         report.append("-" * 70)
-        for tip in prep_package['interview_tips']:
-            report.append(f"  • {tip}")
+        report.extend(f"  • {tip}" for tip in prep_package['interview_tips'])
         
         # Follow-up Template
         report.append("\n📧 THANK-YOU EMAIL TEMPLATE")
@@ -349,6 +520,10 @@ Best regards,
         report.append("=" * 70)
         
         return '\n'.join(report)
+    
+    def close(self):
+        """Close the pooled HTTP session"""
+        self.session.close()
 
 
 # Example usage
@@ -374,3 +549,4 @@ if __name__ == "__main__":
     
     package = prep.prepare_for_interview(test_job, 'Tech Innovations Inc', test_profile)
     print(prep.generate_report(package))
+    prep.close()
@@ -2,21 +2,112 @@
 Job Database - Store and manage found jobs
 """
 
+import csv
 import sqlite3
 import json
+import hashlib
+import queue
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Optional
+
+
+# Applied once per connection
+PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-20000',
+    'PRAGMA busy_timeout=5000',
+)
+
+# Every stored job field, in table order (content_hash is internal)
+JOB_COLUMNS = (
+    'id', 'job_id', 'title', 'company', 'location', 'salary', 'description', 'url', 'source',
+    'posted_date', 'found_date', 'status', 'match_score', 'applied_date', 'notes'
+)
+
+# Enough to render a job in a list without pulling the description
+JOB_SUMMARY_COLUMNS = (
+    'job_id', 'title', 'company', 'location', 'salary', 'url', 'source', 'match_score'
+)
+
+# Enough to match and answer an email about an application
+APPLICATION_COLUMNS = JOB_SUMMARY_COLUMNS + ('status', 'applied_date')
+
+# Hot statements kept as constants so the connection's statement cache
+# always sees the identical SQL text and reuses the prepared plan
+SQL_INSERT_JOB = '''
+    INSERT OR IGNORE INTO jobs 
+    (job_id, title, company, location, salary, description, url, source, posted_date, found_date, match_score, content_hash)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+SQL_INSERT_CONTACT = '''
+    INSERT OR IGNORE INTO contacts 
+    (company_name, name, email, position, source, confidence, found_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+SQL_UPDATE_STATUS = 'UPDATE jobs SET status = ? WHERE job_id = ?'
+
+SQL_MARK_APPLIED = "UPDATE jobs SET status = 'applied', applied_date = ? WHERE job_id = ?"
+
+SQL_INSERT_APPLICATION = "INSERT INTO applications (job_id, applied_date, status) VALUES (?, ?, 'pending')"
+
+SQL_COUNT_BY_STATUS = 'SELECT status, COUNT(*) FROM jobs GROUP BY status'
+
+SQL_INSERT_QUEUED = '''
+    INSERT INTO queued_applications (job_id, scheduled_time, scheduled_at, created_date)
+    VALUES (?, ?, ?, ?)
+'''
+
 
 
 class JobDatabase:
     def __init__(self, db_path: str = "jobs_database.db"):
         self.db_path = db_path
+        self._local = threading.local()
         self.init_database()
     
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None,
+                                   check_same_thread=False, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            for pragma in PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+        return conn
+    
+    @contextmanager
+    def _transaction(self):
+        """Run several statements in one explicit transaction"""
+        conn = self._conn()
+        conn.execute('BEGIN')
+        try:
+            yield conn.cursor()
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+    
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+    
     def init_database(self):
         """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         
         # Jobs table
         cursor.execute('''
@@ -35,10 +126,16 @@ class JobDatabase:
                 status TEXT DEFAULT 'new',
                 match_score REAL,
                 applied_date TEXT,
-                notes TEXT
+                notes TEXT,
+                content_hash TEXT
             )
         ''')
         
+        # Older databases predate the content_hash column
+        job_columns = {row[1] for row in cursor.execute('PRAGMA table_info(jobs)')}
+        if 'content_hash' not in job_columns:
+            cursor.execute('ALTER TABLE jobs ADD COLUMN content_hash TEXT')
+        
         # Applications table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS applications (
@@ -58,12 +155,33 @@ class JobDatabase:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 job_id TEXT,
                 scheduled_time TEXT,
+                scheduled_at INTEGER,
                 status TEXT DEFAULT 'pending',
+                status_at INTEGER,
                 created_date TEXT,
                 FOREIGN KEY (job_id) REFERENCES jobs(job_id)
             )
         ''')
         
+        # scheduled_at (unix epoch) was added after scheduled_time (ISO text);
+        # backfill it in Python so timezone offsets are honoured
+        queue_columns = {row[1] for row in cursor.execute('PRAGMA table_info(queued_applications)')}
+        if 'scheduled_at' not in queue_columns:
+            cursor.execute('ALTER TABLE queued_applications ADD COLUMN scheduled_at INTEGER')
+        missing = cursor.execute(
+            'SELECT id, scheduled_time FROM queued_applications WHERE scheduled_at IS NULL'
+        ).fetchall()
+        if missing:
+            cursor.executemany(
+                'UPDATE queued_applications SET scheduled_at = ? WHERE id = ?',
+                [(self._to_epoch(row[1]), row[0]) for row in missing]
+            )
+        
+        # status_at (unix epoch of the last status change) finds rows left
+        # 'enqueued'/'running' by a dead RQ worker
+        if 'status_at' not in queue_columns:
+            cursor.execute('ALTER TABLE queued_applications ADD COLUMN status_at INTEGER')
+        
         # Search history
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS search_history (
@@ -92,147 +210,127 @@ class JobDatabase:
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        # Indexes for the hot lookups
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status_score ON jobs(status, match_score DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status_applied ON jobs(status, applied_date DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_queue_status_at ON queued_applications(status, scheduled_at)')
+        cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_hash ON jobs(content_hash)')
     
     def add_job(self, job_data: dict) -> bool:
         """Add a new job to the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return self.add_jobs([job_data]) > 0
+    
+    @staticmethod
+    def _content_hash(job_data: dict) -> Optional[str]:
+        """Dedupe key that doesn't depend on the scraper providing a stable job_id"""
+        parts = [str(job_data.get(field) or '') for field in ('source', 'url', 'title', 'company')]
+        if not any(parts):
+            return None
+        return hashlib.sha1('|'.join(parts).encode()).hexdigest()
+    
+    def add_jobs(self, jobs: list) -> int:
+        """Add many jobs in one transaction, returns the number actually inserted"""
+        now = datetime.now().isoformat()
+        rows = [(
+            job_data.get('job_id'),
+            job_data.get('title'),
+            job_data.get('company'),
+            job_data.get('location'),
+            job_data.get('salary'),
+            job_data.get('description'),
+            job_data.get('url'),
+            job_data.get('source'),
+            job_data.get('posted_date'),
+            now,
+            job_data.get('match_score', 0),
+            self._content_hash(job_data)
+        ) for job_data in jobs]
         
         try:
-            cursor.execute('''
-                INSERT OR IGNORE INTO jobs 
-                (job_id, title, company, location, salary, description, url, source, posted_date, found_date, match_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                job_data.get('job_id'),
-                job_data.get('title'),
-                job_data.get('company'),
-                job_data.get('location'),
-                job_data.get('salary'),
-                job_data.get('description'),
-                job_data.get('url'),
-                job_data.get('source'),
-                job_data.get('posted_date'),
-                datetime.now().isoformat(),
-                job_data.get('match_score', 0)
-            ))
-            conn.commit()
-            return cursor.rowcount > 0
+            with self._transaction() as cursor:
+                cursor.executemany(SQL_INSERT_JOB, rows)
+                return cursor.rowcount
         except Exception as e:
-            print(f"Error adding job: {e}")
-            return False
-        finally:
-            conn.close()
+            print(f"Error adding jobs: {e}")
+            return 0
     
-    def get_new_jobs(self) -> list:
+    def get_new_jobs(self, columns: tuple = JOB_SUMMARY_COLUMNS) -> list:
         """Get all jobs with 'new' status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         
-        cursor.execute('SELECT * FROM jobs WHERE status = "new" ORDER BY match_score DESC')
-        columns = [description[0] for description in cursor.description]
-        jobs = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        cursor.execute(f'SELECT {", ".join(columns)} FROM jobs WHERE status = "new" ORDER BY match_score DESC')
+        jobs = [dict(row) for row in cursor]
         
-        conn.close()
         return jobs
     
     def update_job_status(self, job_id: str, status: str):
         """Update job status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         
-        cursor.execute('UPDATE jobs SET status = ? WHERE job_id = ?', (status, job_id))
-        conn.commit()
-        conn.close()
+        cursor.execute(SQL_UPDATE_STATUS, (status, job_id))
     
     def mark_as_applied(self, job_id: str):
-        """Mark a job as applied"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE jobs SET status = 'applied', applied_date = ? WHERE job_id = ?
-        ''', (datetime.now().isoformat(), job_id))
-        
-        cursor.execute('''
-            INSERT INTO applications (job_id, applied_date, status)
-            VALUES (?, ?, 'pending')
-        ''', (job_id, datetime.now().isoformat()))
-        
-        conn.commit()
-        conn.close()
+        """Mark a job as applied and record the application"""
+        applied_date = datetime.now().isoformat()
+        with self._transaction() as cursor:
+            cursor.execute(SQL_MARK_APPLIED, (applied_date, job_id))
+            cursor.execute(SQL_INSERT_APPLICATION, (job_id, applied_date))
     
     def get_stats(self) -> dict:
         """Get application statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        stats = {}
-        
-        cursor.execute('SELECT COUNT(*) FROM jobs')
-        stats['total_jobs'] = cursor.fetchone()[0]
+        cursor = self._conn().cursor()
         
-        cursor.execute('SELECT COUNT(*) FROM jobs WHERE status = "new"')
-        stats['new_jobs'] = cursor.fetchone()[0]
+        cursor.execute(SQL_COUNT_BY_STATUS)
+        by_status = dict(cursor.fetchall())
         
-        cursor.execute('SELECT COUNT(*) FROM jobs WHERE status = "applied"')
-        stats['applied'] = cursor.fetchone()[0]
+        stats = {
+            'total_jobs': sum(by_status.values()),
+            'new_jobs': by_status.get('new', 0),
+            'applied': by_status.get('applied', 0),
+            'rejected': by_status.get('rejected', 0),
+            'interviews': by_status.get('interview', 0),
+        }
         
-        cursor.execute('SELECT COUNT(*) FROM jobs WHERE status = "rejected"')
-        stats['rejected'] = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM jobs WHERE status = "interview"')
-        stats['interviews'] = cursor.fetchone()[0]
-        
-        conn.close()
         return stats
     
-    def get_jobs_by_source(self, source: str) -> list:
+    def get_jobs_by_source(self, source: str, columns: tuple = JOB_SUMMARY_COLUMNS) -> list:
         """Get jobs from a specific source"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         
-        cursor.execute('SELECT * FROM jobs WHERE source = ?', (source,))
-        columns = [description[0] for description in cursor.description]
-        jobs = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        cursor.execute(f'SELECT {", ".join(columns)} FROM jobs WHERE source = ?', (source,))
+        jobs = [dict(row) for row in cursor]
         
-        conn.close()
         return jobs
     
     def add_contact(self, contact_data: dict) -> bool:
         """Add a new contact to the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return self.add_contacts([contact_data]) > 0
+    
+    def add_contacts(self, contacts: list) -> int:
+        """Add many contacts in one transaction, returns the number actually inserted"""
+        now = datetime.now().isoformat()
+        rows = [(
+            contact_data.get('company_name'),
+            contact_data.get('name'),
+            contact_data.get('email'),
+            contact_data.get('position'),
+            contact_data.get('source'),
+            contact_data.get('confidence', 0.5),
+            contact_data.get('found_date', now)
+        ) for contact_data in contacts]
         
         try:
-            cursor.execute('''
-                INSERT OR IGNORE INTO contacts 
-                (company_name, name, email, position, source, confidence, found_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                contact_data.get('company_name'),
-                contact_data.get('name'),
-                contact_data.get('email'),
-                contact_data.get('position'),
-                contact_data.get('source'),
-                contact_data.get('confidence', 0.5),
-                contact_data.get('found_date', datetime.now().isoformat())
-            ))
-            conn.commit()
-            return cursor.rowcount > 0
+            with self._transaction() as cursor:
+                cursor.executemany(SQL_INSERT_CONTACT, rows)
+                return cursor.rowcount
         except Exception as e:
-            print(f"Error adding contact: {e}")
-            return False
-        finally:
-            conn.close()
+            print(f"Error adding contacts: {e}")
+            return 0
     
     def get_contacts_by_company(self, company_name: str) -> list:
         """Get all contacts for a specific company"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         
         cursor.execute('''
             SELECT * FROM contacts 
@@ -240,14 +338,12 @@ class JobDatabase:
             ORDER BY confidence DESC
         ''', (f'%{company_name}%',))
         
-        contacts = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        contacts = [dict(row) for row in cursor]
         return contacts
     
     def add_search_history(self, search_data: dict) -> bool:
         """Add a search history entry"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         
         try:
             cursor.execute('''
@@ -263,97 +359,179 @@ class JobDatabase:
                 search_data.get('jobs_applied', 0),
                 search_data.get('duration', 0)
             ))
-            conn.commit()
             return True
         except Exception as e:
             print(f"Error adding search history: {e}")
             return False
-        finally:
-            conn.close()
     
-    def get_recent_applications(self, days: int = 30) -> list:
+    def get_recent_applications(self, days: int = 30, columns: tuple = APPLICATION_COLUMNS) -> list:
         """Get jobs applied to in the last N days"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
         
-        cursor.execute('''
-            SELECT * FROM jobs 
+        cursor.execute(f'''
+            SELECT {", ".join(columns)} FROM jobs 
             WHERE status = 'applied' 
             AND applied_date >= date('now', '-' || ? || ' days')
             ORDER BY applied_date DESC
         ''', (days,))
         
-        jobs = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        jobs = [dict(row) for row in cursor]
         return jobs
     
+    @staticmethod
+    def _to_epoch(value) -> Optional[int]:
+        """Convert a datetime or ISO-8601 string to unix seconds (naive = local time)"""
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return None
+        return int(value.timestamp()) if value else None
+    
     def add_queued_application(self, job_id: str, scheduled_time: str):
         """Add application to queue for smart timing"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(''' 
-            INSERT INTO queued_applications (job_id, scheduled_time, created_date)
-            VALUES (?, ?, ?)
-        ''', (job_id, scheduled_time, datetime.now().isoformat()))
-        
-        conn.commit()
-        conn.close()
+        cursor = self._conn().cursor()
+        
+        cursor.execute(SQL_INSERT_QUEUED, (
+            job_id,
+            scheduled_time,
+            self._to_epoch(scheduled_time),
+            datetime.now().isoformat()
+        ))
     
     def get_pending_applications(self, current_time: str = None) -> list:
-        """Get applications ready to be submitted"""
-        if current_time is None:
-            current_time = datetime.now().isoformat()
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Get applications ready to be submitted (current_time defaults to now)"""
+        cursor = self._conn().cursor()
         
         cursor.execute(''' 
-            SELECT qa.*, j.* 
+            SELECT qa.id, qa.job_id, qa.scheduled_time,
+                   j.title, j.company, j.location, j.salary, j.url, j.source, j.match_score
             FROM queued_applications qa
             JOIN jobs j ON qa.job_id = j.job_id
             WHERE qa.status = 'pending' 
-            AND qa.scheduled_time <= ?
-            ORDER BY qa.scheduled_time
-        ''', (current_time,))
+            AND qa.scheduled_at <= COALESCE(?, CAST(strftime('%s', 'now') AS INTEGER))
+            ORDER BY qa.scheduled_at
+        ''', (self._to_epoch(current_time),))
         
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        results = [dict(row) for row in cursor]
         
-        conn.close()
         return results
     
     def mark_queue_completed(self, queue_id: int):
         """Mark queued application as completed"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(''' 
-            UPDATE queued_applications 
-            SET status = 'completed'
-            WHERE id = ?
-        ''', (queue_id,))
-        
-        conn.commit()
-        conn.close()
+        self.mark_queue_completed_many([queue_id])
+    
+    def mark_queue_completed_many(self, queue_ids: list):
+        """Mark several queued applications as completed in one statement"""
+        self.set_queue_status(queue_ids, 'completed')
+    
+    def set_queue_status(self, queue_ids: list, status: str):
+        """Set the status ('pending', 'enqueued', 'running', 'completed') of several queued applications"""
+        if not queue_ids:
+            return
+        
+        cursor = self._conn().cursor()
+        placeholders = ', '.join('?' * len(queue_ids))
+        cursor.execute(
+            f"UPDATE queued_applications SET status = ?, status_at = ? WHERE id IN ({placeholders})",
+            [status, int(time.time()), *queue_ids]
+        )
+    
+    def claim_queued(self, queue_id: int) -> bool:
+        """Move an enqueued application to 'running' (False if another run already has it)"""
+        cursor = self._conn().cursor()
+        cursor.execute(
+            "UPDATE queued_applications SET status = 'running', status_at = ? "
+            "WHERE id = ? AND status = 'enqueued'",
+            (int(time.time()), queue_id)
+        )
+        return cursor.rowcount == 1
+    
+    def requeue_stale(self, max_age: int) -> int:
+        """Reset applications 'enqueued' or 'running' for over max_age seconds to 'pending'"""
+        now = int(time.time())
+        cursor = self._conn().cursor()
+        cursor.execute(
+            "UPDATE queued_applications SET status = 'pending', status_at = ? "
+            "WHERE status IN ('enqueued', 'running') AND COALESCE(status_at, 0) <= ?",
+            (now, now - max_age)
+        )
+        return cursor.rowcount
     
     def export_to_csv(self, filepath: str = 'jobs_export.csv'):
         """Export jobs to CSV file"""
-        import csv
+        cursor = self._conn().cursor()
+        cursor.execute(f'SELECT {", ".join(JOB_COLUMNS)} FROM jobs')
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM jobs')
-        jobs = cursor.fetchall()
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        # Stream rows straight from the cursor instead of loading the whole table
+        exported = 0
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow(['ID', 'Job ID', 'Title', 'Company', 'Location', 'Salary', 
                            'Description', 'URL', 'Source', 'Posted Date', 'Found Date', 
                            'Status', 'Match Score', 'Applied Date', 'Notes'])
-            writer.writerows(jobs)
+            for exported, row in enumerate(cursor, 1):
+                writer.writerow(row)
         
-        conn.close()
-        print(f"Exported {len(jobs)} jobs to {filepath}")
+        print(f"Exported {exported} jobs to {filepath}")
+
+
+class JobWriter:
+    """
+    Save jobs in the background while scrapers are still producing them
+    
+    Any thread may call put(); one writer thread drains the queue into
+    add_jobs transactions of up to batch_size rows, flushing at least every
+    flush_interval seconds. close() flushes what is left and returns the
+    number of new jobs saved.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, db: JobDatabase, transform: Callable[[list], list] = None,
+                 batch_size: int = 100, flush_interval: float = 2.0):
+        self.db = db
+        self.transform = transform  # e.g. score/filter a batch before saving
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.saved = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='job-writer', daemon=True)
+        self._thread.start()
+    
+    def put(self, jobs: list):
+        """Queue scraped jobs for saving"""
+        for job in jobs:
+            self._queue.put(job)
+    
+    def close(self) -> int:
+        """Flush remaining jobs, stop the writer thread and return the saved count"""
+        self._queue.put(self._STOP)
+        self._thread.join()
+        return self.saved
+    
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    job = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if job is self._STOP:
+                    stopping = True
+                    break
+                batch.append(job)
+            if batch:
+                self._flush(batch)
+    
+    def _flush(self, batch: list):
+        try:
+            if self.transform:
+                batch = self.transform(batch)
+            if batch:
+                self.saved += self.db.add_jobs(batch)
+        except Exception as e:
+            print(f"Error saving jobs: {e}")
@@ -3,23 +3,27 @@ Job Hunter Bot - Main Application
 Searches LinkedIn and Indeed for jobs, filters them, and optionally auto-applies
 """
 
+import os
 import time
+import atexit
 import argparse
+import queue
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict
+from typing import Callable, List, Dict
 
 from config import (
     PROFILE, JOB_SEARCH, EXCLUDE_KEYWORDS, REQUIRED_KEYWORDS,
     LINKEDIN, INDEED, APPLICATION, EMAIL, DATABASE
 )
-from job_database import JobDatabase
+from job_database import JobDatabase, JobWriter, JOB_COLUMNS
 from job_matcher import JobMatcher
-from linkedin_bot import LinkedInBot
-from indeed_bot import IndeedBot
-from email_notifier import EmailNotifier
 from smart_timing import SmartTiming
-from webhook_notifier import WebhookNotifier
+
+# Selenium bots, notifiers and RQ are imported where they are first used, so
+# commands like --stats and --export start without loading them
 
 # Setup logging
 logging.basicConfig(
@@ -32,6 +36,86 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Keyword searches allowed in flight at once per scraper
+MAX_PARALLEL_PAGES = 3
+
+# RQ time limit per application, and how long a queued application may stay
+# 'enqueued'/'running' before a later run assumes its worker died
+QUEUE_JOB_TIMEOUT = 600
+QUEUE_STALE_AFTER = 3600
+
+
+# Sends queued for the notify workers; daemon threads, so exit waits only as
+# long as _flush_notifications allows
+NOTIFY_WORKERS = 2
+_notify_queue = None
+
+
+def _notify_in_background(send: Callable, *args, **kwargs):
+    """Run a webhook/email send off the main thread; flushed at exit"""
+    global _notify_queue
+    if _notify_queue is None:
+        _notify_queue = queue.Queue()
+        for _ in range(NOTIFY_WORKERS):
+            threading.Thread(target=_notify_worker, name='notify', daemon=True).start()
+        atexit.register(_flush_notifications)
+    _notify_queue.put((send, args, kwargs))
+
+
+def _notify_worker():
+    while True:
+        send, args, kwargs = _notify_queue.get()
+        try:
+            send(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Background notification failed: {e}")
+        finally:
+            _notify_queue.task_done()
+
+
+def _flush_notifications(timeout: float = 30):
+    """Give queued notifications a bounded time to finish"""
+    deadline = time.monotonic() + timeout
+    with _notify_queue.all_tasks_done:
+        while _notify_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(f"Exiting with {_notify_queue.unfinished_tasks} notifications unsent")
+                break
+            _notify_queue.all_tasks_done.wait(remaining)
+
+
+def _job_key(job: Dict):
+    """Identity of a scraped job: its id, else where it was found"""
+    return job.get('job_id') or (job.get('source'), job.get('url'))
+
+
+def dedupe_jobs(jobs: List[Dict]) -> List[Dict]:
+    """Drop repeats of the same job (across keywords or sources), keeping the first seen"""
+    unique = {}
+    for job in jobs:
+        unique.setdefault(_job_key(job), job)
+    return list(unique.values())
+
+
+class RateLimiter:
+    """Space out requests to one site, shared safely between threads"""
+    
+    def __init__(self, rps: float):
+        self.interval = 1.0 / rps
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block only for what remains of the interval since the last reserved slot"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
 class JobHunter:
     def __init__(self):
         self.db = JobDatabase(DATABASE['path'])
@@ -44,18 +128,23 @@ class JobHunter:
         self.linkedin_bot = None
         self.indeed_bot = None
         self.email_notifier = None
+        self.response_manager = None
         self.smart_timing = SmartTiming()
+        # Politeness limits per site; time spent loading pages counts toward the gap
+        self.linkedin_limiter = RateLimiter(rps=0.5)
+        self.indeed_limiter = RateLimiter(rps=1)
         self.webhook_notifier = None
         
         # Initialize webhook if configured
-        import os
         webhook_url = os.getenv('WEBHOOK_URL')
         webhook_platform = os.getenv('WEBHOOK_PLATFORM', 'slack')
         if webhook_url:
+            from webhook_notifier import WebhookNotifier
             self.webhook_notifier = WebhookNotifier(webhook_url, webhook_platform)
         
         # Initialize email if configured
         if APPLICATION['send_email_summary'] and EMAIL.get('from_email'):
+            from email_notifier import EmailNotifier
             self.email_notifier = EmailNotifier(
                 smtp_server=EMAIL['smtp_server'],
                 smtp_port=EMAIL['smtp_port'],
@@ -87,43 +176,60 @@ class JobHunter:
         print(f"🌐 Sources: {', '.join(sources)}")
         print("="*60 + "\n")
         
-        # Search LinkedIn
-        if 'linkedin' in sources:
-            linkedin_jobs = self._search_linkedin(headless)
-            all_jobs.extend(linkedin_jobs)
-        
-        # Search Indeed
-        if 'indeed' in sources:
-            indeed_jobs = self._search_indeed(headless)
-            all_jobs.extend(indeed_jobs)
-        
-        # Filter and score jobs
+        # Save matching jobs in the background as each keyword search finishes,
+        # so persistence overlaps with scraping instead of following it
+        writer = None
+        if APPLICATION['save_jobs']:
+            saved_keys = set()  # only touched from the writer thread
+            
+            def keep_new_matches(batch: List[Dict]) -> List[Dict]:
+                fresh = [job for job in dedupe_jobs(batch) if _job_key(job) not in saved_keys]
+                saved_keys.update(_job_key(job) for job in fresh)
+                return self.matcher.filter_jobs(fresh, min_score=40)
+            
+            writer = JobWriter(self.db, transform=keep_new_matches)
+        on_jobs = writer.put if writer else None
+        
+        # Search each source in its own browser session, concurrently
+        searches = {
+            'linkedin': self._search_linkedin,
+            'indeed': self._search_indeed,
+        }
+        selected = [source for source in searches if source in sources]
+        try:
+            if selected:
+                with ThreadPoolExecutor(max_workers=len(selected)) as executor:
+                    futures = [executor.submit(searches[source], headless, on_jobs=on_jobs)
+                               for source in selected]
+                    # Collect in source order so results stay deterministic
+                    for future in futures:
+                        all_jobs.extend(future.result())
+        finally:
+            if writer:
+                new_count = writer.close()
+                print(f"💾 Saved {new_count} new jobs to database")
+        
+        # Overlapping keywords return the same postings; score each one once
+        all_jobs = dedupe_jobs(all_jobs)
+        
+        # Filter and score jobs; the writer already scored the ones it saw
         print("\n📊 Analyzing jobs...")
-        filtered_jobs = self.matcher.filter_jobs(all_jobs, min_score=40)
+        filtered_jobs = self.matcher.filter_jobs(all_jobs, min_score=40, keep_scores=writer is not None)
         
         print(f"\n✅ Found {len(filtered_jobs)} jobs matching your criteria (out of {len(all_jobs)} total)")
         
         # Notify about high-match jobs
         if self.webhook_notifier:
-            for job in filtered_jobs:
-                if job.get('match_score', 0) >= 70:
-                    self.webhook_notifier.notify_new_job(job)
-        
-        # Save to database
-        if APPLICATION['save_jobs']:
-            new_count = 0
-            for job in filtered_jobs:
-                if self.db.add_job(job):
-                    new_count += 1
-            print(f"💾 Saved {new_count} new jobs to database")
+            _notify_in_background(self.webhook_notifier.notify_new_jobs, filtered_jobs)
         
         # Display top jobs
         self._display_top_jobs(filtered_jobs[:10])
         
-        # Send email summary
+        # Send email summary (SMTP runs in the background)
         if self.email_notifier and filtered_jobs:
             stats = self.db.get_stats()
-            self.email_notifier.send_job_summary(
+            _notify_in_background(
+                self.email_notifier.send_job_summary,
                 recipient_email=EMAIL['recipient_email'],
                 jobs=filtered_jobs,
                 stats=stats
@@ -131,17 +237,20 @@ class JobHunter:
         
         return filtered_jobs
     
-    def _search_linkedin(self, headless: bool = False, max_retries: int = 3) -> List[Dict]:
-        """Search LinkedIn for jobs with retry logic"""
+    def _search_linkedin(self, headless: bool = False, max_retries: int = 3,
+                         on_jobs: Callable[[List[Dict]], None] = None) -> List[Dict]:
+        """Search LinkedIn for jobs with retry logic (on_jobs receives each keyword's results)"""
         print("\n🔵 Searching LinkedIn...")
         
         for attempt in range(max_retries):
             try:
                 if not self.linkedin_bot:
+                    from linkedin_bot import LinkedInBot
                     self.linkedin_bot = LinkedInBot(
                         LINKEDIN['email'], 
                         LINKEDIN['password'],
-                        headless=headless
+                        headless=headless,
+                        user_data_dir=LINKEDIN.get('profile_dir')
                     )
                 
                 if not self.linkedin_bot.logged_in:
@@ -155,13 +264,15 @@ class JobHunter:
                 
                 jobs = []
                 for keyword in JOB_SEARCH['keywords']:
+                    self.linkedin_limiter.wait()  # Be nice to LinkedIn
                     keyword_jobs = self.linkedin_bot.search_jobs(
                         keywords=keyword,
                         location=JOB_SEARCH['location'],
                         easy_apply_only=LINKEDIN.get('easy_apply_only', True)
                     )
+                    if on_jobs:
+                        on_jobs(keyword_jobs)
                     jobs.extend(keyword_jobs)
-                    time.sleep(5)  # Be nice to LinkedIn
                 
                 print(f"✅ Found {len(jobs)} jobs on LinkedIn")
                 logger.info(f"LinkedIn search successful: {len(jobs)} jobs found")
@@ -178,25 +289,36 @@ class JobHunter:
         
         return []
     
-    def _search_indeed(self, headless: bool = False, max_retries: int = 3) -> List[Dict]:
-        """Search Indeed for jobs with retry logic"""
+    def _search_indeed(self, headless: bool = False, max_retries: int = 3,
+                       on_jobs: Callable[[List[Dict]], None] = None) -> List[Dict]:
+        """Search Indeed for jobs with retry logic (on_jobs receives each keyword's results)"""
         print("\n🟢 Searching Indeed...")
         
         for attempt in range(max_retries):
             try:
                 if not self.indeed_bot:
+                    from indeed_bot import IndeedBot
                     self.indeed_bot = IndeedBot(headless=headless)
                 
-                jobs = []
-                for keyword in JOB_SEARCH['keywords']:
+                def search_keyword(keyword: str) -> List[Dict]:
+                    self.indeed_limiter.wait()  # Be nice to Indeed
                     keyword_jobs = self.indeed_bot.search_jobs(
                         keywords=keyword,
                         location=JOB_SEARCH['location'],
                         posted_within_days=JOB_SEARCH.get('posted_within_days', 7),
                         remote=JOB_SEARCH.get('remote', False)
                     )
-                    jobs.extend(keyword_jobs)
-                    time.sleep(3)  # Be nice to Indeed
+                    if on_jobs:
+                        on_jobs(keyword_jobs)
+                    return keyword_jobs
+                
+                # Indeed searches go through the shared requests session, so
+                # keywords can be fetched side by side; the limiter staggers
+                # their start instead of a fixed sleep after each one
+                jobs = []
+                with ThreadPoolExecutor(max_workers=MAX_PARALLEL_PAGES) as executor:
+                    for keyword_jobs in executor.map(search_keyword, JOB_SEARCH['keywords']):
+                        jobs.extend(keyword_jobs)
                 
                 print(f"✅ Found {len(jobs)} jobs on Indeed")
                 logger.info(f"Indeed search successful: {len(jobs)} jobs found")
@@ -244,7 +366,7 @@ class JobHunter:
             return
         
         if jobs is None:
-            jobs = self.db.get_new_jobs()
+            jobs = self.db.get_new_jobs(JOB_COLUMNS)
         
         # Filter for easy apply only
         easy_apply_jobs = [j for j in jobs if j.get('easy_apply')]
@@ -270,8 +392,10 @@ class JobHunter:
             try:
                 if 'linkedin' in job.get('source', ''):
                     if not self.linkedin_bot:
+                        from linkedin_bot import LinkedInBot
                         self.linkedin_bot = LinkedInBot(
-                            LINKEDIN['email'], LINKEDIN['password']
+                            LINKEDIN['email'], LINKEDIN['password'],
+                            user_data_dir=LINKEDIN.get('profile_dir')
                         )
                         self.linkedin_bot.login()
                     
@@ -287,6 +411,7 @@ class JobHunter:
                         continue
                 else:
                     if not self.indeed_bot:
+                        from indeed_bot import IndeedBot
                         self.indeed_bot = IndeedBot()
                 
                 # Delay between applications
@@ -318,11 +443,14 @@ class JobHunter:
             from email_finder import EmailFinder
             
             finder = EmailFinder(company_name)
+            found = finder.find_all_contacts()
+            rhe, site_manager = found['rhe'], found['site_manager']
             
-            # Find RHE contact
-            rhe = finder.find_rhe_contact()
+            contacts = []
+            
+            # RHE contact
             if rhe:
-                self.db.add_contact({
+                contacts.append({
                     'company_name': company_name,
                     'name': rhe.get('name', 'RHE'),
                     'email': rhe.get('email'),
@@ -332,10 +460,9 @@ class JobHunter:
                 })
                 print(f"      ✅ Found RHE: {rhe.get('email')}")
             
-            # Find Site Manager contact
-            site_manager = finder.find_site_manager_contact()
+            # Site Manager contact
             if site_manager:
-                self.db.add_contact({
+                contacts.append({
                     'company_name': company_name,
                     'name': site_manager.get('name', 'Site Manager'),
                     'email': site_manager.get('email'),
@@ -345,6 +472,9 @@ class JobHunter:
                 })
                 print(f"      ✅ Found Site Manager: {site_manager.get('email')}")
             
+            # Both rows in one transaction
+            self.db.add_contacts(contacts)
+            
             if not rhe and not site_manager:
                 print(f"      ℹ️ No contacts found for {company_name}")
                 
@@ -358,13 +488,16 @@ class JobHunter:
             
             print("\n📧 Checking for email responses...")
             
-            config = {
-                'profile': PROFILE,
-                'email': EMAIL
-            }
+            # Kept between checks so a long-lived hunter reuses its IMAP
+            # session; close() logs out
+            if not self.response_manager:
+                config = {
+                    'profile': PROFILE,
+                    'email': EMAIL
+                }
+                self.response_manager = ResponseManager(config, DATABASE['path'])
             
-            manager = ResponseManager(config, DATABASE['path'])
-            manager.check_and_process_responses()
+            self.response_manager.check_and_process_responses()
             
             print("✅ Email check complete")
             
@@ -375,6 +508,10 @@ class JobHunter:
         """Process applications that are ready to be submitted"""
         print("\n⏰ Processing queued applications...")
         
+        requeued = self.db.requeue_stale(QUEUE_STALE_AFTER)
+        if requeued:
+            print(f"♻️ Requeued {requeued} applications left by a stopped worker")
+        
         pending = self.db.get_pending_applications()
         
         if not pending:
@@ -383,6 +520,54 @@ class JobHunter:
         
         print(f"Found {len(pending)} applications ready to submit")
         
+        redis_url = os.getenv('REDIS_URL')
+        if redis_url and self._enqueue_queued(pending, redis_url):
+            return
+        
+        completed_ids = []
+        try:
+            self._submit_queued(pending, completed_ids)
+        finally:
+            # Drain the queue in one UPDATE, even if the run was interrupted
+            self.db.mark_queue_completed_many(completed_ids)
+    
+    def _enqueue_queued(self, pending: List[Dict], redis_url: str) -> bool:
+        """Hand pending applications to RQ workers, one queue per source (False without rq)"""
+        # Optional: rq/redis are only needed when REDIS_URL is configured
+        try:
+            from redis import Redis
+            from rq import Queue
+        except ImportError:
+            print("⚠️ REDIS_URL is set but rq is not installed - submitting in-process")
+            return False
+        
+        connection = Redis.from_url(redis_url)
+        queues = {}
+        enqueued = 0
+        for app in pending:
+            # Separate queues let the worker count cap concurrency per site
+            name = 'applications-linkedin' if 'linkedin' in (app.get('source') or '') else 'applications-indeed'
+            if name not in queues:
+                queues[name] = Queue(name, connection=connection)
+            
+            # Marked before enqueue() so a worker that finishes first isn't
+            # overwritten, and the next run won't enqueue it again
+            self.db.set_queue_status([app['id']], 'enqueued')
+            try:
+                queues[name].enqueue(apply_queued_application, app, job_timeout=QUEUE_JOB_TIMEOUT)
+            except Exception as e:
+                # The rest stay 'pending' for the next run
+                self.db.set_queue_status([app['id']], 'pending')
+                print(f"❌ Error enqueuing applications: {e}")
+                break
+            enqueued += 1
+        
+        print(f"📤 Enqueued {enqueued} applications "
+              f"(run: rq worker {' '.join(sorted(queues))})")
+        return True
+    
+    def _submit_queued(self, pending: List[Dict], completed_ids: List[int]):
+        """Submit each pending application, collecting the queue ids that succeeded"""
         for app in pending:
             job = {
                 'job_id': app['job_id'],
@@ -397,8 +582,10 @@ class JobHunter:
             try:
                 if 'linkedin' in job.get('source', ''):
                     if not self.linkedin_bot:
+                        from linkedin_bot import LinkedInBot
                         self.linkedin_bot = LinkedInBot(
-                            LINKEDIN['email'], LINKEDIN['password']
+                            LINKEDIN['email'], LINKEDIN['password'],
+                            user_data_dir=LINKEDIN.get('profile_dir')
                         )
                         self.linkedin_bot.login()
                     
@@ -408,13 +595,14 @@ class JobHunter:
                     )
                 else:
                     if not self.indeed_bot:
+                        from indeed_bot import IndeedBot
                         self.indeed_bot = IndeedBot()
                     
                     success, complex_questions = self.indeed_bot.apply_to_job(job.get('url'), PROFILE)
                 
                 if success:
                     self.db.mark_as_applied(job.get('job_id'))
-                    self.db.mark_queue_completed(app['id'])
+                    completed_ids.append(app['id'])
                     print("   ✅ Application submitted!")
                     
                     if self.email_notifier:
@@ -431,6 +619,46 @@ class JobHunter:
     def export_jobs(self, filepath: str = "jobs_export.csv"):
         """Export jobs to CSV"""
         self.db.export_to_csv(filepath)
+    
+    def close(self):
+        """Quit any browsers the bots opened and log out of IMAP"""
+        for bot in (self.linkedin_bot, self.indeed_bot):
+            if bot:
+                try:
+                    bot.close()
+                except Exception as e:
+                    logger.warning(f"Error closing bot: {e}")
+        self.linkedin_bot = None
+        self.indeed_bot = None
+        
+        if self.response_manager:
+            self.response_manager.close_connection()
+            self.response_manager = None
+
+
+_worker_hunter = None
+
+
+def apply_queued_application(app: Dict):
+    """RQ task: submit one queued application, reusing the worker's browser sessions"""
+    global _worker_hunter
+    if _worker_hunter is None:
+        _worker_hunter = JobHunter()
+    
+    # Skip copies already handled (a stale row requeued while its first
+    # copy was still waiting in Redis)
+    if not _worker_hunter.db.claim_queued(app['id']):
+        return
+    
+    completed_ids = []
+    try:
+        _worker_hunter._submit_queued([app], completed_ids)
+    finally:
+        if completed_ids:
+            _worker_hunter.db.mark_queue_completed_many(completed_ids)
+        else:
+            # Leave it for a later run, as the in-process loop does
+            _worker_hunter.db.set_queue_status([app['id']], 'pending')
 
 
 def main():
@@ -470,6 +698,8 @@ def main():
     if not any([args.search, args.apply, args.stats, args.export]):
         # Default: run search
         hunter.run_search()
+    
+    hunter.close()
 
 
 if __name__ == "__main__":
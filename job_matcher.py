@@ -3,17 +3,137 @@ Job Matcher - Analyzes jobs against your profile and preferences
 """
 
 import re
-from typing import Dict, List
+import heapq
+from operator import itemgetter
+from typing import Dict, List, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: Hyperscan scans every keyword in one SIMD pass (x86 only)
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Only the head of a description is scored; matches past it rarely change the score
+MAX_DESC_CHARS = 4000
+
+# Text patterns signalling each experience level
+_EXPERIENCE_PATTERNS = {
+    'entry': [r'entry.?level', r'junior', r'graduate', r'0-2 years', r'débutant'],
+    'junior': [r'junior', r'1-3 years', r'2-3 years'],
+    'mid': [r'mid.?level', r'3-5 years', r'intermediate'],
+    'senior': [r'senior', r'5\+ years', r'lead', r'principal'],
+}
+
+# Posting-age phrases earning the recency bonus
+_POSTED_TODAY_RE = re.compile(r"today|aujourd'hui|just|hour", re.IGNORECASE)
+_POSTED_YESTERDAY_RE = re.compile(r"yesterday|hier|1 day", re.IGNORECASE)
+
+# First amount in a salary string (spaces/commas as thousands separators),
+# and the markers of a monthly figure
+_SALARY_RE = re.compile(r'\d[\d ,]*')
+_MONTHLY_RE = re.compile(r'month|mois|/[ ,]*m', re.IGNORECASE)
+
+
+def _build_automaton(keywords: List[str]):
+    """Aho-Corasick automaton mapping each keyword to itself (None if unavailable)"""
+    if ahocorasick is None or not keywords:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_hyperscan_db(keywords: List[str]):
+    """Compile all keywords into one literal-match Hyperscan database (None if unavailable)"""
+    if hyperscan is None or not keywords:
+        return None
+    
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(kw).encode() for kw in keywords],
+        ids=list(range(len(keywords))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8]
+              * len(keywords)
+    )
+    return db
 
 
 class JobMatcher:
     def __init__(self, required_keywords: List[str], exclude_keywords: List[str],
-                 experience_level: List[str] = None, min_salary: int = None):
-        self.required_keywords = [kw.lower() for kw in required_keywords]
-        self.exclude_keywords = [kw.lower() for kw in exclude_keywords]
+                 experience_level: List[str] = None, min_salary: int = None,
+                 max_desc_chars: int = MAX_DESC_CHARS):
+        # dict.fromkeys dedupes while keeping the configured order
+        self.required_keywords = list(dict.fromkeys(kw.lower() for kw in required_keywords))
+        self.exclude_keywords = list(dict.fromkeys(kw.lower() for kw in exclude_keywords))
         self.experience_level = experience_level or []
         self.min_salary = min_salary
+        self.max_desc_chars = max_desc_chars
+        
+        # One linear pass per job instead of one substring scan per keyword:
+        # a single Hyperscan database over both lists when available, else
+        # one Aho-Corasick automaton per list
+        self._keyword_db = _build_hyperscan_db(self.required_keywords + self.exclude_keywords)
+        self._required_ac = self._exclude_ac = None
+        if self._keyword_db is None:
+            self._required_ac = _build_automaton(self.required_keywords)
+            self._exclude_ac = _build_automaton(self.exclude_keywords)
+        
+        # One fused, precompiled regex per configured experience level
+        self._experience_res = [
+            re.compile('|'.join(_EXPERIENCE_PATTERNS[level]), re.IGNORECASE)
+            for level in self.experience_level
+            if level in _EXPERIENCE_PATTERNS
+        ]
+    
+    def _keyword_hits(self, text: str) -> Tuple[Set[str], Set[str]]:
+        """Return the (required, excluded) keywords occurring in text"""
+        if self._keyword_db is not None:
+            return self._scan_hyperscan(text)
+        return (self._find_keywords(self.required_keywords, self._required_ac, text),
+                self._find_keywords(self.exclude_keywords, self._exclude_ac, text))
+    
+    def _scan_hyperscan(self, text: str) -> Tuple[Set[str], Set[str]]:
+        """Single fused scan; ids below len(required_keywords) are required keywords"""
+        n_required = len(self.required_keywords)
+        required, excluded = set(), set()
         
+        def on_match(keyword_id, start, end, flags, context):
+            if keyword_id < n_required:
+                required.add(self.required_keywords[keyword_id])
+            else:
+                excluded.add(self.exclude_keywords[keyword_id - n_required])
+        
+        self._keyword_db.scan(text.encode(), match_event_handler=on_match)
+        return required, excluded
+    
+    def _find_keywords(self, keywords: List[str], automaton, text: str) -> Set[str]:
+        """Return the subset of keywords occurring in text"""
+        if automaton is not None:
+            return {keyword for _, keyword in automaton.iter(text)}
+        return {keyword for keyword in keywords if keyword in text}
+        
+    def _prepare(self, job: Dict) -> str:
+        """"title description" text to match (description capped at max_desc_chars),
+        computed once and cached on the job"""
+        full_text = job.get('_match_text')
+        if full_text is None:
+            description = (job.get('description') or '')[:self.max_desc_chars]
+            full_text = f"{job.get('title') or ''} {description}"
+            # Hyperscan and the experience regexes are case-insensitive; only
+            # the Aho-Corasick / substring fallback needs a lowercased copy
+            if self._keyword_db is None:
+                full_text = full_text.lower()
+            job['_match_text'] = full_text
+        return full_text
+    
     def calculate_match_score(self, job: Dict) -> float:
         """
         Calculate how well a job matches the search criteria
@@ -21,40 +141,25 @@ class JobMatcher:
         """
         score = 50  # Base score
         
-        title = job.get('title', '').lower()
-        description = job.get('description', '').lower()
-        full_text = f"{title} {description}"
+        full_text = self._prepare(job)
+        
+        required_hits, excluded_hits = self._keyword_hits(full_text)
         
         # Check for excluded keywords (-30 points each, can go negative)
-        for keyword in self.exclude_keywords:
-            if keyword in full_text:
-                score -= 30
+        score -= 30 * len(excluded_hits)
                 
         # Check for required keywords (+15 points each)
-        keywords_found = 0
-        for keyword in self.required_keywords:
-            if keyword in full_text:
-                score += 15
-                keywords_found += 1
+        keywords_found = len(required_hits)
+        score += 15 * keywords_found
         
         # Bonus for having multiple required keywords
         if keywords_found >= 3:
             score += 10
         
-        # Experience level check
-        experience_patterns = {
-            'entry': [r'entry.?level', r'junior', r'graduate', r'0-2 years', r'débutant'],
-            'junior': [r'junior', r'1-3 years', r'2-3 years'],
-            'mid': [r'mid.?level', r'3-5 years', r'intermediate'],
-            'senior': [r'senior', r'5\+ years', r'lead', r'principal'],
-        }
-        
-        for level in self.experience_level:
-            if level in experience_patterns:
-                for pattern in experience_patterns[level]:
-                    if re.search(pattern, full_text):
-                        score += 10
-                        break
+        # Experience level check (+10 per configured level that matches)
+        for pattern in self._experience_res:
+            if pattern.search(full_text):
+                score += 10
         
         # Salary check (if provided)
         salary_text = job.get('salary', '')
@@ -71,10 +176,10 @@ class JobMatcher:
             score += 5
         
         # Recent posting bonus
-        posted = job.get('posted_date', '').lower()
-        if any(word in posted for word in ['today', "aujourd'hui", 'just', 'hour']):
+        posted = job.get('posted_date', '')
+        if _POSTED_TODAY_RE.search(posted):
             score += 10
-        elif any(word in posted for word in ['yesterday', 'hier', '1 day']):
+        elif _POSTED_YESTERDAY_RE.search(posted):
             score += 5
             
         # Cap score between 0 and 100
@@ -82,18 +187,14 @@ class JobMatcher:
     
     def _parse_salary(self, salary_text: str) -> int:
         """Parse salary from text, return annual amount"""
-        salary_text = salary_text.lower().replace(' ', '').replace(',', '')
-        
-        # Try to find numbers
-        numbers = re.findall(r'\d+', salary_text)
-        if not numbers:
-            return 0
-        
         # Get the main number
-        salary = int(numbers[0])
+        match = _SALARY_RE.search(salary_text)
+        if not match:
+            return 0
+        salary = int(match.group().replace(' ', '').replace(',', ''))
         
         # Check if it's monthly (convert to annual)
-        if 'month' in salary_text or 'mois' in salary_text or '/m' in salary_text:
+        if _MONTHLY_RE.search(salary_text):
             salary *= 12
         
         # Handle K notation (e.g., 45K)
@@ -102,37 +203,49 @@ class JobMatcher:
             
         return salary
     
-    def filter_jobs(self, jobs: List[Dict], min_score: int = 40) -> List[Dict]:
-        """Filter and score jobs, return only those above minimum score"""
-        scored_jobs = []
+    def score_jobs(self, jobs: List[Dict]) -> List[float]:
+        """Score a batch of jobs, storing each score on its job dict"""
+        score = self.calculate_match_score
+        scores = [score(job) for job in jobs]
+        for job, job_score in zip(jobs, scores):
+            job['match_score'] = job_score
+        return scores
+    
+    def filter_jobs(self, jobs: List[Dict], min_score: int = 40, top_k: int = None,
+                    keep_scores: bool = False) -> List[Dict]:
+        """
+        Filter and score jobs, return only those above minimum score
         
-        for job in jobs:
-            score = self.calculate_match_score(job)
-            job['match_score'] = score
-            
-            if score >= min_score:
-                scored_jobs.append(job)
+        Args:
+            top_k: Only return the k best jobs (partial heap selection instead of a full sort)
+            keep_scores: Don't rescore jobs that already carry a match_score
+        """
+        self.score_jobs([job for job in jobs if 'match_score' not in job] if keep_scores else jobs)
+        scored_jobs = [job for job in jobs if job['match_score'] >= min_score]
+        
+        if top_k is not None:
+            return heapq.nlargest(top_k, scored_jobs, key=itemgetter('match_score'))
         
         # Sort by score (highest first)
-        scored_jobs.sort(key=lambda x: x['match_score'], reverse=True)
+        scored_jobs.sort(key=itemgetter('match_score'), reverse=True)
         
         return scored_jobs
     
     def get_match_explanation(self, job: Dict) -> str:
         """Get explanation of why a job matched or didn't match"""
-        title = job.get('title', '').lower()
-        description = job.get('description', '').lower()
-        full_text = f"{title} {description}"
+        full_text = self._prepare(job)
         
         reasons = []
         
+        required_hits, excluded_hits = self._keyword_hits(full_text)
+        
         # Found required keywords
-        found_keywords = [kw for kw in self.required_keywords if kw in full_text]
+        found_keywords = [kw for kw in self.required_keywords if kw in required_hits]
         if found_keywords:
             reasons.append(f"✅ Keywords found: {', '.join(found_keywords)}")
         
         # Found excluded keywords
-        found_excluded = [kw for kw in self.exclude_keywords if kw in full_text]
+        found_excluded = [kw for kw in self.exclude_keywords if kw in excluded_hits]
         if found_excluded:
             reasons.append(f"⚠️ Excluded keywords found: {', '.join(found_excluded)}")
         
@@ -3,9 +3,19 @@ LinkedIn Job Search and Apply Bot
 Uses Selenium for browser automation
 """
 
+import os
+import re
 import time
+import asyncio
+import atexit
+import shutil
+import socket
+import subprocess
+import urllib.request
+from urllib.parse import urlparse
 import random
 import hashlib
+import threading
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 
@@ -17,68 +27,370 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import (
     TimeoutException, 
-    NoSuchElementException,
     ElementClickInterceptedException
 )
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Optional: fetch job descriptions concurrently
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Public job-posting fragment; serves the full description without a browser
+JOB_DETAIL_URL = 'https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}'
+DESCRIPTION_TAGS = SoupStrainer(class_='show-more-less-html__markup')
+MAX_DESCRIPTION_FETCHES = 5
+
+# Wording that marks a free-text question needing a human answer
+COMPLEX_KEYWORDS = (
+    'why', 'describe', 'explain', 'tell us', 'tell me',
+    'experience with', 'motivation', 'interest in',
+    'what makes you', 'how would you', 'provide details',
+    'elaborate', 'summary', 'background', 'qualifications'
+)
+_COMPLEX_RE = re.compile('|'.join(map(re.escape, COMPLEX_KEYWORDS)), re.IGNORECASE)
+
+# Selectors and scripts are built once and always sent as the same string
+_SEL_JOB_CARD = '.job-card-container'
+_SEL_LOGIN_SUBMIT = 'button[type="submit"]'
+_SEL_APPLY_BUTTON = '.jobs-apply-button'
+_SEL_MODAL = '.artdeco-modal'
+_SEL_MODAL_HEADER = '.artdeco-modal__header'
+_SEL_FORM_FIELDS = 'input, textarea, select, label'
+
+# Fields read from each job card, relative to the card
+_SEL_CARD_FIELDS = {
+    'link': 'a.job-card-container__link',
+    'title': '.job-card-list__title',
+    'company': '.job-card-container__company-name',
+    'location': '.job-card-container__metadata-item',
+}
+
+# aria-labels of the Easy Apply step buttons
+_LABEL_NEXT = 'Continue to next step'
+_LABEL_REVIEW = 'Review your application'
+_LABEL_SUBMIT = 'Submit application'
+
+_JS_HIDE_WEBDRIVER = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+_JS_USER_AGENT = "return navigator.userAgent"
+
+# Every labelled button on the page as {aria-label: element}, in one round-trip
+_JS_LABELED_BUTTONS = """
+return Object.fromEntries(
+    Array.from(document.querySelectorAll('button[aria-label]')).map((b) => [b.getAttribute('aria-label'), b])
+);
+"""
+
+# Scroll the results until no new cards show up: each scroll waits on a
+# MutationObserver for more cards (up to quietMs) instead of polling from Python
+_JS_SCROLL_UNTIL_STABLE = """
+const [selector, maxScrolls, quietMs, done] = arguments;
+const count = () => document.querySelectorAll(selector).length;
+let last = count(), scrolls = 0, timer = null, finished = false;
+const finish = () => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    done(last);
+};
+const scroll = () => {
+    scrolls += 1;
+    window.scrollTo(0, document.body.scrollHeight);
+    clearTimeout(timer);
+    timer = setTimeout(finish, quietMs);
+};
+const observer = new MutationObserver(() => {
+    const n = count();
+    if (n > last) {
+        last = n;
+        if (scrolls >= maxScrolls) finish(); else scroll();
+    }
+});
+observer.observe(document.body, {childList: true, subtree: true});
+scroll();
+"""
+
+# One round-trip for the whole result list: the fields of the first N cards
+_JS_CARD_FIELDS = """
+const [cardSelector, fields, limit] = arguments;
+return Array.from(document.querySelectorAll(cardSelector)).slice(0, limit).map((card) => {
+    const text = (sel) => { const el = card.querySelector(sel); return el ? el.innerText.trim() : null; };
+    const link = card.querySelector(fields.link);
+    return {
+        title: text(fields.title),
+        company: text(fields.company),
+        location: text(fields.location),
+        url: link ? link.href : null,
+        easy_apply: /Easy Apply|Candidature simplifi/.test(card.innerText)
+    };
+});
+"""
+
+# One round-trip per form step: what _classify_question needs for every field
+_JS_FORM_FIELDS = """
+return Array.from(document.querySelectorAll(arguments[0])).map((el) => {
+    const forLabel = el.id ? document.querySelector('label[for="' + CSS.escape(el.id) + '"]') : null;
+    const parent = el.parentElement;
+    return {
+        tag: el.tagName.toLowerCase(),
+        type: el.getAttribute('type'),
+        maxlength: el.getAttribute('maxlength'),
+        placeholder: el.getAttribute('placeholder'),
+        aria_label: el.getAttribute('aria-label'),
+        label: el.getAttribute('label'),
+        title: el.getAttribute('title'),
+        for_label: forLabel ? forLabel.innerText : null,
+        parent_label: parent && parent.tagName === 'LABEL' ? parent.innerText : null
+    };
+});
+"""
+
+
+def chrome_options(headless: bool = False, user_data_dir: str = None) -> Options:
+    """Chrome options for a bot's own browser
+    
+    user_data_dir persists cookies between runs; one Chrome at a time per directory.
+    """
+    options = Options()
+    if headless:
+        options.add_argument('--headless')
+    if user_data_dir:
+        user_data_dir = os.path.expanduser(user_data_dir)
+        os.makedirs(user_data_dir, exist_ok=True)
+        options.add_argument(f'--user-data-dir={user_data_dir}')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument('--start-maximized')
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    
+    # Add user agent to appear more human
+    options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    return options
+
+
+def widen_command_pool(driver, maxsize: int = 20):
+    """
+    Let the driver keep up to maxsize keep-alive connections to chromedriver
+    
+    Selenium's urllib3 pool holds a single connection per host by default, so
+    bursts of commands (or a driver touched from another thread) churn TCP
+    connections and log "connection pool is full".
+    """
+    manager = getattr(driver.command_executor, '_conn', None)
+    if manager is not None:
+        manager.connection_pool_kw.update(maxsize=maxsize, block=False)
+        manager.clear()  # pools are rebuilt lazily with the new size
+
+
+def launch_chrome(options: Options) -> webdriver.Chrome:
+    """Start Chrome and hide the navigator.webdriver flag"""
+    driver = webdriver.Chrome(options=options, keep_alive=True)
+    widen_command_pool(driver)
+    driver.execute_script(_JS_HIDE_WEBDRIVER)
+    return driver
+
+
+# Profile of the shared browser; it holds the LinkedIn session cookies, so it
+# lives in a directory only the user can read
+SHARED_PROFILE_DIR = '~/.jobbot/chrome-profile'
+
+
+def _port_is_free(port: int) -> bool:
+    """True if nothing listens on 127.0.0.1:port"""
+    with socket.socket() as sock:
+        try:
+            sock.bind(('127.0.0.1', port))
+            return True
+        except OSError:
+            return False
+
+
+class SharedChromium:
+    """
+    One Chromium process that several bots attach to over CDP, one tab each
+    
+    Tabs share the browser's network/storage processes (and its cookies, so
+    one LinkedIn login serves every bot) instead of each bot owning a full
+    Chrome. Use SharedChromium.get() to start or reuse the process.
+    
+    With port 0 Chrome picks a free debugging port and reports it in the
+    profile's DevToolsActivePort file; a fixed port must not be in use, so
+    bots never attach to some other browser listening there.
+    """
+    
+    _instance = None
+    _lock = threading.Lock()
+    
+    def __init__(self, port: int = 0, user_data_dir: str = SHARED_PROFILE_DIR,
+                 headless: bool = False):
+        if port and not _port_is_free(port):
+            raise RuntimeError(f"Port {port} is already in use - not attaching to another browser")
+        
+        user_data_dir = os.path.expanduser(user_data_dir)
+        os.makedirs(user_data_dir, mode=0o700, exist_ok=True)
+        os.chmod(user_data_dir, 0o700)
+        
+        # Chrome writes the port it bound here; a stale file names an old browser
+        self._port_file = os.path.join(user_data_dir, 'DevToolsActivePort')
+        try:
+            os.remove(self._port_file)
+        except FileNotFoundError:
+            pass
+        self.port = None
+        
+        binary = os.environ.get('CHROME_BINARY') or next(
+            (path for path in map(shutil.which, ('google-chrome', 'chromium', 'chromium-browser', 'chrome')) if path),
+            None
+        )
+        if not binary:
+            raise RuntimeError("Chrome not found - set CHROME_BINARY")
+        
+        args = [
+            binary,
+            f'--remote-debugging-port={port}',
+            f'--user-data-dir={user_data_dir}',
+            '--no-first-run',
+            '--no-default-browser-check',
+            '--no-sandbox',
+            '--disable-dev-shm-usage',
+            '--disable-blink-features=AutomationControlled',
+        ]
+        if headless:
+            args.append('--headless=new')
+        self.process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        atexit.register(self.close)
+        self._wait_until_ready()
+    
+    @classmethod
+    def get(cls, **kwargs) -> 'SharedChromium':
+        """Start the shared browser on first use, then keep returning it"""
+        with cls._lock:
+            if cls._instance is None or cls._instance.process.poll() is not None:
+                cls._instance = cls(**kwargs)
+            return cls._instance
+    
+    def _wait_until_ready(self, timeout: float = 10):
+        """Read the port our Chrome bound, then wait until it answers there"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            # Exits at once if another Chrome already runs on this profile
+            if self.process.poll() is not None:
+                raise RuntimeError("Shared Chromium exited on startup (profile already in use?)")
+            try:
+                if self.port is None:
+                    with open(self._port_file) as f:
+                        self.port = int(f.readline())
+                urllib.request.urlopen(f'http://127.0.0.1:{self.port}/json/version', timeout=1).close()
+                return
+            except (OSError, ValueError):
+                time.sleep(0.1)
+        raise RuntimeError("Shared Chromium did not open its debugging port")
+    
+    def options(self) -> Options:
+        """Options that attach a new WebDriver session to this browser"""
+        options = Options()
+        options.add_experimental_option('debuggerAddress', f'127.0.0.1:{self.port}')
+        return options
+    
+    def close(self):
+        """Stop the browser process"""
+        if self.process.poll() is None:
+            self.process.terminate()
 
 
 class LinkedInBot:
-    def __init__(self, email: str, password: str, headless: bool = False):
+    def __init__(self, email: str, password: str, headless: bool = False,
+                 shared: bool = False, user_data_dir: Optional[str] = None):
         self.email = email
         self.password = password
         self.driver = None
+        self.wait = None
         self.headless = headless
+        self.shared = shared
+        self.user_data_dir = user_data_dir
         self.logged_in = False
         
     def setup_driver(self):
-        """Setup Chrome driver with options"""
-        options = Options()
-        if self.headless:
-            options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_argument('--start-maximized')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        # Add user agent to appear more human
-        options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        """Setup Chrome driver with options (or a tab in the shared browser, if requested)"""
+        if self.driver:
+            return
         
-        self.driver = webdriver.Chrome(options=options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if self.shared:
+            chromium = SharedChromium.get(headless=self.headless)
+            self.driver = webdriver.Chrome(options=chromium.options(), keep_alive=True)
+            widen_command_pool(self.driver)
+            # Work in a tab of our own so bots sharing the browser don't collide
+            self.driver.switch_to.new_window('tab')
+        else:
+            self.driver = launch_chrome(chrome_options(self.headless, self.user_data_dir))
+        # Explicit waits on real page conditions replace fixed sleeps. No implicit
+        # wait: apply_easy_apply probes for buttons that are usually absent.
+        self.wait = WebDriverWait(self.driver, 10)
         
     def random_delay(self, min_sec: float = 1, max_sec: float = 3):
         """Add random delay to appear more human"""
         time.sleep(random.uniform(min_sec, max_sec))
+    
+    def jitter(self):
+        """Short human-like pause between actions once the page is ready"""
+        self.random_delay(0.1, 0.3)
+    
+    def _wait_for(self, condition, timeout: float = None) -> bool:
+        """Wait until condition holds; False on timeout instead of raising"""
+        try:
+            wait = self.wait if timeout is None else WebDriverWait(self.driver, timeout)
+            wait.until(condition)
+            return True
+        except TimeoutException:
+            return False
         
     def login(self) -> bool:
         """Login to LinkedIn"""
         try:
             self.setup_driver()
+            
+            # A session saved in the Chrome profile lands straight on the feed
+            # (a fresh profile has none, so skip the extra page load there)
+            if self.user_data_dir or self.shared:
+                self.driver.get('https://www.linkedin.com/feed/')
+                # (logged out, LinkedIn redirects to /login?session_redirect=...feed...)
+                if urlparse(self.driver.current_url).path.startswith('/feed'):
+                    self.logged_in = True
+                    print("✅ Already logged in to LinkedIn (saved session)")
+                    return True
+            
             self.driver.get('https://www.linkedin.com/login')
-            self.random_delay(2, 4)
             
             # Enter email
-            email_field = WebDriverWait(self.driver, 10).until(
+            email_field = self.wait.until(
                 EC.presence_of_element_located((By.ID, 'username'))
             )
+            self.jitter()
             email_field.send_keys(self.email)
-            self.random_delay()
+            self.jitter()
             
             # Enter password
             password_field = self.driver.find_element(By.ID, 'password')
             password_field.send_keys(self.password)
-            self.random_delay()
+            self.jitter()
             
             # Click login
-            login_button = self.driver.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
+            login_button = self.driver.find_element(By.CSS_SELECTOR, _SEL_LOGIN_SUBMIT)
             login_button.click()
             
-            # Wait for login to complete
-            self.random_delay(3, 5)
+            # Wait for login to complete (a security check leaves us elsewhere)
+            self._wait_for(EC.any_of(EC.url_contains('feed'), EC.url_contains('mynetwork')), timeout=15)
             
             # Check if login successful
             if 'feed' in self.driver.current_url or 'mynetwork' in self.driver.current_url:
@@ -119,87 +431,127 @@ class LinkedInBot:
                 search_url += time_filters[posted_within]
             
             self.driver.get(search_url)
-            self.random_delay(3, 5)
+            if not self._wait_for(EC.presence_of_element_located((By.CSS_SELECTOR, _SEL_JOB_CARD))):
+                print("Found 0 job listings")
+                return jobs
             
-            # Scroll to load more jobs
-            for _ in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                self.random_delay(1, 2)
+            # Scroll to load more jobs, stopping as soon as no new cards appear
+            try:
+                self.driver.execute_async_script(_JS_SCROLL_UNTIL_STABLE, _SEL_JOB_CARD, 3, 2000)
+            except TimeoutException:
+                pass  # keep whatever cards have loaded
             
-            # Find job cards
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, '.job-card-container')
+            # Harvest the first 25 cards in one call; no clicking through each one
+            cards = self.driver.execute_script(_JS_CARD_FIELDS, _SEL_JOB_CARD, _SEL_CARD_FIELDS, 25)
             
-            print(f"Found {len(job_cards)} job listings")
+            print(f"Found {len(cards)} job listings")
             
-            for card in job_cards[:25]:  # Limit to first 25
-                try:
-                    job_data = self._extract_job_data(card)
-                    if job_data:
-                        jobs.append(job_data)
-                except Exception as e:
-                    print(f"Error extracting job: {e}")
-                    continue
+            for card in cards:
+                job_data = self._extract_job_data(card, easy_apply_only)
+                if job_data:
+                    jobs.append(job_data)
+            
+            # Descriptions come from the job pages, fetched side by side
+            self._fill_descriptions(jobs)
                     
         except Exception as e:
             print(f"Search error: {e}")
         
         return jobs
     
-    def _extract_job_data(self, card) -> Optional[Dict]:
-        """Extract job data from a job card"""
+    def _extract_job_data(self, card: Dict, easy_apply_only: bool = False) -> Optional[Dict]:
+        """Build a job from the fields harvested off one job card"""
+        title, company, location = card['title'], card['company'], card['location']
+        if title is None or company is None or location is None:
+            print("Error extracting job data: incomplete job card")
+            return None
+        
+        # Try to get job URL
+        if card['url']:
+            job_url = card['url']
+            job_id = job_url.split('/')[-2]
+        else:
+            job_url = self.driver.current_url
+            job_id = hashlib.blake2b(f"{title}{company}".encode(), digest_size=6).hexdigest()
+        
+        return {
+            'job_id': f"linkedin_{job_id}",
+            'title': title,
+            'company': company,
+            'location': location,
+            'description': '',  # filled in by _fill_descriptions
+            'url': job_url,
+            'source': 'linkedin',
+            'easy_apply': easy_apply_only or card['easy_apply'],
+            'posted_date': datetime.now().isoformat(),
+            'salary': ''  # LinkedIn often doesn't show salary
+        }
+    
+    def _fill_descriptions(self, jobs: List[Dict]):
+        """Fetch every job's description concurrently (first 500 chars)"""
+        urls = {
+            job['job_id']: JOB_DETAIL_URL.format(job_id=job['job_id'][len('linkedin_'):])
+            for job in jobs if job['job_id'][len('linkedin_'):].isdigit()
+        }
+        if not urls:
+            return
+        
+        # Reuse the browser's session so the requests look like the same visitor
+        cookies = {cookie['name']: cookie['value'] for cookie in self.driver.get_cookies()}
+        headers = {'User-Agent': self.driver.execute_script(_JS_USER_AGENT)}
+        
         try:
-            # Click on job card to load details
-            card.click()
-            self.random_delay(1, 2)
-            
-            # Extract basic info
-            title = card.find_element(By.CSS_SELECTOR, '.job-card-list__title').text
-            company = card.find_element(By.CSS_SELECTOR, '.job-card-container__company-name').text
-            location = card.find_element(By.CSS_SELECTOR, '.job-card-container__metadata-item').text
-            
-            # Try to get job URL
-            try:
-                job_link = card.find_element(By.CSS_SELECTOR, 'a.job-card-container__link')
-                job_url = job_link.get_attribute('href')
-                job_id = job_url.split('/')[-2] if job_url else None
-            except:
-                job_url = self.driver.current_url
-                job_id = hashlib.md5(f"{title}{company}".encode()).hexdigest()[:12]
-            
-            # Try to get description from detail panel
-            description = ""
-            try:
-                desc_element = WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.jobs-description__content'))
-                )
-                description = desc_element.text[:500]  # First 500 chars
-            except:
-                pass
-            
-            # Check for Easy Apply button
-            easy_apply = False
-            try:
-                self.driver.find_element(By.CSS_SELECTOR, '.jobs-apply-button--top-card')
-                easy_apply = True
-            except:
-                pass
-            
-            return {
-                'job_id': f"linkedin_{job_id}",
-                'title': title,
-                'company': company,
-                'location': location,
-                'description': description,
-                'url': job_url,
-                'source': 'linkedin',
-                'easy_apply': easy_apply,
-                'posted_date': datetime.now().isoformat(),
-                'salary': ''  # LinkedIn often doesn't show salary
-            }
-            
+            if aiohttp and not self._in_event_loop():
+                pages = asyncio.run(self._fetch_pages_async(urls, cookies, headers))
+            else:
+                pages = self._fetch_pages_sync(urls, cookies, headers)
         except Exception as e:
-            print(f"Error extracting job data: {e}")
-            return None
+            print(f"Error fetching job descriptions: {e}")
+            return
+        
+        for job in jobs:
+            html = pages.get(job['job_id'])
+            if html:
+                markup = BeautifulSoup(html, HTML_PARSER, parse_only=DESCRIPTION_TAGS)
+                job['description'] = markup.get_text(' ', strip=True)[:500]  # First 500 chars
+    
+    @staticmethod
+    def _in_event_loop() -> bool:
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+    
+    @staticmethod
+    async def _fetch_pages_async(urls: Dict[str, str], cookies: Dict, headers: Dict) -> Dict[str, str]:
+        connector = aiohttp.TCPConnector(limit=MAX_DESCRIPTION_FETCHES)
+        timeout = aiohttp.ClientTimeout(total=10, connect=3)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         cookies=cookies, headers=headers) as session:
+            async def fetch(url: str) -> str:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    return await response.text()
+            
+            keys = list(urls)
+            results = await asyncio.gather(*(fetch(urls[key]) for key in keys), return_exceptions=True)
+        return {key: html for key, html in zip(keys, results) if isinstance(html, str)}
+    
+    @staticmethod
+    def _fetch_pages_sync(urls: Dict[str, str], cookies: Dict, headers: Dict) -> Dict[str, str]:
+        pages = {}
+        with requests.Session() as session:
+            session.cookies.update(cookies)
+            session.headers.update(headers)
+            for key, url in urls.items():
+                try:
+                    response = session.get(url, timeout=(3, 10))
+                    response.raise_for_status()
+                    pages[key] = response.text
+                except requests.RequestException:
+                    continue
+        return pages
     
     def apply_easy_apply(self, job_url: str, resume_path: str = None) -> Tuple[bool, List[Dict]]:
         """Apply to a job using Easy Apply
@@ -211,14 +563,14 @@ class LinkedInBot:
         """
         try:
             self.driver.get(job_url)
-            self.random_delay(2, 4)
             
             # Find Easy Apply button
-            easy_apply_btn = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '.jobs-apply-button'))
+            easy_apply_btn = self.wait.until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, _SEL_APPLY_BUTTON))
             )
+            self.jitter()
             easy_apply_btn.click()
-            self.random_delay(2, 3)
+            self._wait_for(EC.presence_of_element_located((By.CSS_SELECTOR, _SEL_MODAL)))
             
             # Handle multi-step application
             complex_questions = []
@@ -235,43 +587,30 @@ class LinkedInBot:
                     print(f"⚠️ Detected {len(detected_complex)} complex question(s) - pausing application")
                     return (False, complex_questions)
                 
-                try:
-                    # Look for next/submit button
-                    next_btn = self.driver.find_element(By.CSS_SELECTOR, 'button[aria-label="Continue to next step"]')
-                    next_btn.click()
-                    self.random_delay(1, 2)
-                except NoSuchElementException:
-                    pass
-                
-                try:
-                    # Look for review button
-                    review_btn = self.driver.find_element(By.CSS_SELECTOR, 'button[aria-label="Review your application"]')
-                    review_btn.click()
-                    self.random_delay(1, 2)
-                except NoSuchElementException:
-                    pass
+                # Read the step's buttons once and press the furthest one along
+                buttons = self.driver.execute_script(_JS_LABELED_BUTTONS)
                 
-                try:
-                    # Look for submit button
-                    submit_btn = self.driver.find_element(By.CSS_SELECTOR, 'button[aria-label="Submit application"]')
+                # Look for submit button
+                if _LABEL_SUBMIT in buttons:
+                    submit_btn = buttons[_LABEL_SUBMIT]
                     submit_btn.click()
-                    self.random_delay(2, 3)
+                    self._wait_for(EC.staleness_of(submit_btn), timeout=5)
                     print("✅ Application submitted!")
                     return (True, [])
-                except NoSuchElementException:
-                    pass
                 
-                # Check if we're done or stuck
-                try:
-                    # Check for success message
-                    success = self.driver.find_element(By.CSS_SELECTOR, '.artdeco-modal__header')
-                    if 'submitted' in success.text.lower():
-                        return (True, [])
-                except:
-                    pass
+                # Look for review or next button, then handle the new step
+                step_btn = buttons.get(_LABEL_REVIEW) or buttons.get(_LABEL_NEXT)
+                if step_btn:
+                    step_btn.click()
+                    self._wait_for(EC.staleness_of(step_btn), timeout=5)
+                    continue
                 
-                # Timeout check
-                self.random_delay(1, 2)
+                # Check if we're done or stuck: look for a success message
+                headers = self.driver.find_elements(By.CSS_SELECTOR, _SEL_MODAL_HEADER)
+                if headers and 'submitted' in headers[0].text.lower():
+                    return (True, [])
+                
+                # Stuck
                 break
                 
             return (False, complex_questions)
@@ -289,20 +628,20 @@ class LinkedInBot:
         complex_questions = []
         
         try:
-            # Find all input fields, textareas, and labels
-            form_elements = self.driver.find_elements(By.CSS_SELECTOR, 'input, textarea, select, label')
+            # Read every input field, textarea and label in one script call
+            form_fields = self.driver.execute_script(_JS_FORM_FIELDS, _SEL_FORM_FIELDS)
             
-            for element in form_elements:
-                question_type = self._classify_question(element)
+            for field in form_fields:
+                question_type = self._classify_question(field)
                 
                 if question_type == 'complex':
                     # Extract question details
-                    question_text = self._extract_question_text(element)
+                    question_text = self._extract_question_text(field)
                     
                     if question_text:
                         complex_questions.append({
                             'text': question_text,
-                            'element_type': element.tag_name,
+                            'element_type': field['tag'],
                             'detected_at': datetime.now().isoformat()
                         })
         
@@ -311,14 +650,17 @@ class LinkedInBot:
         
         return complex_questions
     
-    def _classify_question(self, element) -> str:
+    def _classify_question(self, field: Dict) -> str:
         """Classify if a question is simple or complex
         
+        Args:
+            field: Form field attributes as read by _JS_FORM_FIELDS
+        
         Returns:
             'simple', 'complex', or 'unknown'
         """
         try:
-            tag = element.tag_name
+            tag = field['tag']
             
             # Textareas are always complex (long-form answers)
             if tag == 'textarea':
@@ -326,7 +668,7 @@ class LinkedInBot:
             
             # Check input fields
             if tag == 'input':
-                input_type = element.get_attribute('type') or 'text'
+                input_type = field['type'] or 'text'
                 
                 # Simple types
                 if input_type in ['checkbox', 'radio', 'hidden', 'submit', 'button']:
@@ -334,22 +676,12 @@ class LinkedInBot:
                 
                 # Text inputs - check for complexity indicators
                 if input_type in ['text', 'email', 'tel', 'url']:
-                    # Get associated text
-                    text = self._extract_question_text(element).lower()
-                    
-                    # Complex keywords
-                    complex_keywords = [
-                        'why', 'describe', 'explain', 'tell us', 'tell me',
-                        'experience with', 'motivation', 'interest in',
-                        'what makes you', 'how would you', 'provide details',
-                        'elaborate', 'summary', 'background', 'qualifications'
-                    ]
-                    
-                    if any(keyword in text for keyword in complex_keywords):
+                    # Complex keywords in the associated text
+                    if _COMPLEX_RE.search(self._extract_question_text(field)):
                         return 'complex'
                     
                     # Check max length - long inputs suggest complex answers
-                    max_length = element.get_attribute('maxlength')
+                    max_length = field['maxlength']
                     if max_length and int(max_length) > 200:
                         return 'complex'
                 
@@ -364,49 +696,38 @@ class LinkedInBot:
         except Exception as e:
             return 'unknown'
     
-    def _extract_question_text(self, element) -> str:
-        """Extract the question text associated with a form element"""
-        try:
-            # Try different methods to get question text
-            text_sources = [
-                element.get_attribute('placeholder'),
-                element.get_attribute('aria-label'),
-                element.get_attribute('label'),
-                element.get_attribute('title')
-            ]
-            
-            # Try to find associated label
-            try:
-                element_id = element.get_attribute('id')
-                if element_id:
-                    label = self.driver.find_element(By.CSS_SELECTOR, f'label[for="{element_id}"]')
-                    text_sources.append(label.text)
-            except:
-                pass
-            
-            # Try parent label
-            try:
-                parent = element.find_element(By.XPATH, '..')
-                if parent.tag_name == 'label':
-                    text_sources.append(parent.text)
-            except:
-                pass
-            
-            # Return first non-empty text
-            for text in text_sources:
-                if text and text.strip():
-                    return text.strip()
-            
-            return ''
-            
-        except Exception as e:
-            return ''
+    def _extract_question_text(self, field: Dict) -> str:
+        """Extract the question text associated with a form field"""
+        # Attributes first, then a label[for=id], then an enclosing label
+        text_sources = (
+            field['placeholder'],
+            field['aria_label'],
+            field['label'],
+            field['title'],
+            field['for_label'],
+            field['parent_label'],
+        )
+        
+        # Return first non-empty text
+        for text in text_sources:
+            if text and text.strip():
+                return text.strip()
+        
+        return ''
     
     def close(self):
-        """Close the browser"""
+        """Close the browser (or just our tab of the shared one)"""
         if self.driver:
-            self.driver.quit()
-            print("Browser closed")
+            if self.shared:
+                # Close only our tab and detach; the browser keeps serving other bots
+                self.driver.close()
+                self.driver.service.stop()
+            else:
+                self.driver.quit()
+                print("Browser closed")
+            self.driver = None
+            self.wait = None
+            self.logged_in = False
 
 
 def test_linkedin():
@@ -4,22 +4,96 @@ Profile Optimizer - Analyze job keywords and suggest profile improvements
 
 from typing import Dict, List, Set
 from collections import Counter
+import heapq
 import re
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Common stop words to ignore
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'should', 'could', 'may', 'might', 'must', 'can', 'this', 'that',
+    'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
+})
+
+# Runs of letters, digits and hyphens at least 3 long (shorter words are ignored)
+_TOKEN_RE = re.compile(r'[a-z0-9\-]{3,}')
+
+# Common technical bigrams
+TECH_PATTERNS = (
+    'machine learning', 'data science', 'artificial intelligence',
+    'deep learning', 'natural language', 'computer vision',
+    'cloud computing', 'software development', 'web development',
+    'mobile development', 'full stack', 'front end', 'back end',
+    'database management', 'project management', 'agile development',
+    'continuous integration', 'continuous deployment', 'version control'
+)
+
+# Define category patterns
+PROGRAMMING_LANGS = frozenset({
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby',
+    'go', 'rust', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab'
+})
+
+FRAMEWORKS = frozenset({
+    'react', 'angular', 'vue', 'django', 'flask', 'spring', 'express',
+    'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy'
+})
+
+TOOLS = frozenset({
+    'git', 'docker', 'kubernetes', 'jenkins', 'aws', 'azure', 'gcp',
+    'jira', 'confluence', 'slack', 'linux', 'windows', 'macos'
+})
+
+SOFT_SKILLS = frozenset({
+    'leadership', 'communication', 'teamwork', 'problem-solving',
+    'analytical', 'creative', 'organized', 'detail-oriented'
+})
+
+METHODOLOGIES = frozenset({
+    'agile', 'scrum', 'kanban', 'devops', 'ci/cd', 'tdd', 'bdd'
+})
+
+KEYWORD_CATEGORIES = (
+    ('programming_languages', PROGRAMMING_LANGS),
+    ('frameworks', FRAMEWORKS),
+    ('tools', TOOLS),
+    ('soft_skills', SOFT_SKILLS),
+    ('methodologies', METHODOLOGIES),
+)
+
+# Keyword -> category in one dict (earlier categories win on overlap)
+KEYWORD_CATEGORY = {
+    keyword: category
+    for category, members in reversed(KEYWORD_CATEGORIES)
+    for keyword in members
+}
+
+
+def _build_bigram_matcher():
+    """Find every tech bigram in one pass: Aho-Corasick if available, else one regex"""
+    if ahocorasick is None:
+        pattern = re.compile('|'.join(map(re.escape, TECH_PATTERNS)))
+        return lambda text: {match.group() for match in pattern.finditer(text)}
+    
+    automaton = ahocorasick.Automaton()
+    for bigram in TECH_PATTERNS:
+        automaton.add_word(bigram, bigram)
+    automaton.make_automaton()
+    return lambda text: {bigram for _, bigram in automaton.iter(text)}
+
+
+_find_bigrams = _build_bigram_matcher()
+
 
 class ProfileOptimizer:
     """Analyze keyword gaps between jobs and user profile"""
     
-    def __init__(self):
-        # Common stop words to ignore
-        self.stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-            'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'should', 'could', 'may', 'might', 'must', 'can', 'this', 'that',
-            'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
-        }
-    
     def analyze_keyword_gaps(self, jobs: List[Dict], profile: Dict) -> Dict:
         """
         Find keywords in jobs missing from profile
@@ -37,15 +111,17 @@ class ProfileOptimizer:
         # Extract keywords from profile
         profile_keywords = self._extract_keywords_from_profile(profile)
         
-        # Find missing keywords
-        missing = set(job_keywords.keys()) - set(profile_keywords.keys())
+        # Find missing keywords with their counts; one pass over the job
+        # keywords also gives the number of matching ones
+        missing = {
+            keyword: count for keyword, count in job_keywords.items()
+            if keyword not in profile_keywords
+        }
+        matching = len(job_keywords) - len(missing)
         
-        # Sort by frequency in job descriptions
-        missing_sorted = sorted(
-            missing,
-            key=lambda k: job_keywords[k],
-            reverse=True
-        )[:30]  # Top 30 missing keywords
+        # Top 30 missing keywords by frequency in job descriptions (ties keep
+        # first-seen order), without sorting everything
+        missing_sorted = heapq.nlargest(30, missing, key=missing.__getitem__)
         
         # Categorize keywords
         categorized = self._categorize_keywords(missing_sorted, job_keywords)
@@ -54,28 +130,32 @@ class ProfileOptimizer:
         suggestions = self._generate_suggestions(categorized, profile)
         
         # Identify priority skills
-        priority_skills = self._identify_priority_skills(job_keywords, profile_keywords)
+        priority_skills = self._identify_priority_skills(job_keywords, missing)
         
         return {
             'missing_keywords': missing_sorted,
-            'keyword_frequency': {k: job_keywords[k] for k in missing_sorted},
+            'keyword_frequency': {k: missing[k] for k in missing_sorted},
             'categorized_keywords': categorized,
             'suggestions': suggestions,
             'priority_skills': priority_skills,
-            'profile_strength': self._calculate_profile_strength(job_keywords, profile_keywords)
+            'profile_strength': self._calculate_profile_strength(len(job_keywords), matching)
         }
     
     def _extract_keywords_from_jobs(self, jobs: List[Dict]) -> Counter:
         """Extract and count keywords from job descriptions"""
-        keywords = Counter()
+        # Combine title and description
+        texts = [f"{job.get('title', '')} {job.get('description', '')}".lower() for job in jobs]
         
-        for job in jobs:
-            # Combine title and description
-            text = f"{job.get('title', '')} {job.get('description', '')}"
-            
-            # Extract keywords
-            words = self._extract_keywords(text)
-            keywords.update(words)
+        # Tokenize the whole batch in one scan (newlines keep jobs apart) and
+        # let Counter tally it in C
+        keywords = Counter(
+            word for word in _TOKEN_RE.findall('\n'.join(texts))
+            if word not in STOP_WORDS
+        )
+        
+        # Bigrams count once per job
+        for text in texts:
+            keywords.update(self._extract_bigrams(text))
         
         return keywords
     
@@ -103,16 +183,11 @@ class ProfileOptimizer:
         # Convert to lowercase
         text = text.lower()
         
-        # Remove special characters but keep spaces and hyphens
-        text = re.sub(r'[^a-z0-9\s\-]', ' ', text)
-        
-        # Split into words
-        words = text.split()
-        
-        # Filter out stop words and short words
+        # Words of 3+ letters/digits/hyphens in one scan (anything else separates
+        # words), minus stop words
         keywords = [
-            word for word in words
-            if word not in self.stop_words and len(word) > 2
+            word for word in _TOKEN_RE.findall(text)
+            if word not in STOP_WORDS
         ]
         
         # Also extract common multi-word phrases
@@ -122,26 +197,11 @@ class ProfileOptimizer:
         return keywords
     
     def _extract_bigrams(self, text: str) -> List[str]:
-        """Extract common two-word phrases"""
-        words = text.split()
-        bigrams = []
-        
-        # Common technical bigrams
-        tech_patterns = [
-            'machine learning', 'data science', 'artificial intelligence',
-            'deep learning', 'natural language', 'computer vision',
-            'cloud computing', 'software development', 'web development',
-            'mobile development', 'full stack', 'front end', 'back end',
-            'database management', 'project management', 'agile development',
-            'continuous integration', 'continuous deployment', 'version control'
-        ]
-        
-        text_lower = text.lower()
-        for pattern in tech_patterns:
-            if pattern in text_lower:
-                bigrams.append(pattern.replace(' ', '_'))
-        
-        return bigrams
+        """Extract common two-word phrases (text must already be lowercased)"""
+        found = _find_bigrams(text)
+        if not found:
+            return []
+        return [pattern.replace(' ', '_') for pattern in TECH_PATTERNS if pattern in found]
     
     def _categorize_keywords(self, keywords: List[str], frequency: Counter) -> Dict:
         """Categorize keywords into technical skills, soft skills, tools, etc."""
@@ -154,44 +214,8 @@ class ProfileOptimizer:
             'other': []
         }
         
-        # Define category patterns
-        programming_langs = {
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby',
-            'go', 'rust', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab'
-        }
-        
-        frameworks = {
-            'react', 'angular', 'vue', 'django', 'flask', 'spring', 'express',
-            'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy'
-        }
-        
-        tools = {
-            'git', 'docker', 'kubernetes', 'jenkins', 'aws', 'azure', 'gcp',
-            'jira', 'confluence', 'slack', 'linux', 'windows', 'macos'
-        }
-        
-        soft_skills = {
-            'leadership', 'communication', 'teamwork', 'problem-solving',
-            'analytical', 'creative', 'organized', 'detail-oriented'
-        }
-        
-        methodologies = {
-            'agile', 'scrum', 'kanban', 'devops', 'ci/cd', 'tdd', 'bdd'
-        }
-        
         for keyword in keywords:
-            if keyword in programming_langs:
-                categories['programming_languages'].append(keyword)
-            elif keyword in frameworks:
-                categories['frameworks'].append(keyword)
-            elif keyword in tools:
-                categories['tools'].append(keyword)
-            elif keyword in soft_skills:
-                categories['soft_skills'].append(keyword)
-            elif keyword in methodologies:
-                categories['methodologies'].append(keyword)
-            else:
-                categories['other'].append(keyword)
+            categories[KEYWORD_CATEGORY.get(keyword, 'other')].append(keyword)
         
         return categories
     
@@ -247,13 +271,13 @@ class ProfileOptimizer:
         
         return suggestions
     
-    def _identify_priority_skills(self, job_keywords: Counter, profile_keywords: Counter) -> List[Dict]:
+    def _identify_priority_skills(self, job_keywords: Counter, missing: Dict[str, int]) -> List[Dict]:
         """Identify high-demand skills to prioritize learning"""
         # Find keywords that appear frequently in jobs but not in profile
         priority = []
         
         for keyword, count in job_keywords.most_common(50):
-            if keyword not in profile_keywords:
+            if keyword in missing:
                 priority.append({
                     'skill': keyword,
                     'demand': count,
@@ -262,10 +286,8 @@ class ProfileOptimizer:
         
         return priority[:15]  # Top 15 priority skills
     
-    def _calculate_profile_strength(self, job_keywords: Counter, profile_keywords: Counter) -> Dict:
-        """Calculate profile strength score"""
-        total_job_keywords = len(job_keywords)
-        matching_keywords = len(set(job_keywords.keys()) & set(profile_keywords.keys()))
+    def _calculate_profile_strength(self, total_job_keywords: int, matching_keywords: int) -> Dict:
+        """Calculate profile strength score from distinct job keywords and how many the profile has"""
         
         if total_job_keywords == 0:
             strength_score = 0
@@ -3,274 +3,518 @@ Response Handler - Manages different types of responses and follow-ups
 """
 
 import re
-import random
+import sys
+import unicodedata
+from string import Template
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from email_finder import EmailFinder
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: Hyperscan scans every keyword in one SIMD pass (x86 only)
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Optional: RE2 runs the fallback alternation in guaranteed linear time
+try:
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
+
+# Indicators match anywhere in the text, not as whole tokens: 'refus' must
+# also score 'refusé'/'refuser' and 'meet' must catch 'meeting', so a
+# token-set lookup would silently drop matches. Matching is accent-blind (see
+# _fold), so one stem per word family is enough.
+
+# Check for common positive responses
+POSITIVE_INDICATORS = (
+    'intéressé', 'intéressant', 'souhaitez-vous', 'disponible',
+    'entretien', 'rencontrer', 'convoquer', 'disponibilité', 'parler',
+    'téléphone', 'appel', 'zoom', 'teams', 'meet', 'visio',
+    'expérience', 'cv', 'curriculum vitae', 'parcours',
+    'poste', 'mission', 'profil', 'candidature'
+)
+
+# Check for negative responses
+NEGATIVE_INDICATORS = (
+    'ne correspond pas', 'pas retenu', 'pas sélectionné', 'malheureusement',
+    'candidature retenue', 'poste pourvu', 'plus avancer',
+    'pas le profil', 'pas d\'opportunité', 'pas d\'ouverture', 'pas de poste',
+    'rester en contact', 'prochaine opportunité', 'candidature future',
+    'refus', 'déclin'
+)
+
+# Check for information requests
+INFO_REQUESTS = (
+    'plus d\'information', 'plus de détails', 'précision', 'préciser',
+    'questions', 'renseignement', 'savoir plus', 'en savoir plus',
+    'disponible', 'expérience', 'compétence', 'formation', 'diplôme',
+    'rémunération', 'salaire', 'prétention salariale', 'prétention',
+    'début', 'disponibilité', 'mobile', 'télétravail', 'présentiel',
+    'permis', 'véhicule', 'déplacement', 'mobilité'
+)
+
+# Words that turn a positive reply into an interview request
+INTERVIEW_WORDS = ('entretien', 'rencontre', 'rencontrer', 'disponible')
+
+# Score slots: positive, negative, information request
+POSITIVE, NEGATIVE, INFO = range(3)
+
+_COMBINING_MARKS_RE = re.compile('[\u0300-\u036f]')
+
+
+@lru_cache(maxsize=256)
+def _fold(text: str) -> str:
+    """Lowercase and strip accents ('Refusée' -> 'refusee'); memoized, so an
+    email analyzed again (retries, re-processing) is folded only once"""
+    return _COMBINING_MARKS_RE.sub('', unicodedata.normalize('NFKD', text.lower()))
+
+
+def _indicator_slots() -> Dict[str, Tuple[int, ...]]:
+    """
+    Map each keyword to the score slots it counts towards, once per listing, so
+    words in two lists (or listed twice) score exactly as with per-list scans
+    
+    Keys are interned: the matchers hand back these same string objects, so
+    every lookup hits on identity. Interview words are matched in the same
+    scan; those outside the lists score nothing.
+    """
+    slots = {}
+    for slot, indicators in ((POSITIVE, POSITIVE_INDICATORS), (NEGATIVE, NEGATIVE_INDICATORS),
+                             (INFO, INFO_REQUESTS)):
+        for word in indicators:
+            slots.setdefault(sys.intern(_fold(word)), []).append(slot)
+    for word in INTERVIEW_WORDS:
+        slots.setdefault(sys.intern(_fold(word)), [])
+    return {word: tuple(word_slots) for word, word_slots in slots.items()}
+
+
+_INDICATOR_SLOTS = _indicator_slots()
+_INDICATOR_WORDS = tuple(_INDICATOR_SLOTS)
+_INTERVIEW_KEYS = frozenset(_fold(word) for word in INTERVIEW_WORDS)
+
+
+def _build_indicator_db():
+    """All indicator keywords in one literal-match Hyperscan database (None if unavailable)"""
+    if hyperscan is None:
+        return None
+    
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(word).encode() for word in _INDICATOR_WORDS],
+        ids=list(range(len(_INDICATOR_WORDS))),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_INDICATOR_WORDS)
+    )
+    return db
+
+
+def _build_indicator_automaton():
+    """One Aho-Corasick automaton over all three indicator lists (None if unavailable)"""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for word in _INDICATOR_SLOTS:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+# Fallback without pyahocorasick: one precompiled alternation (longest keyword
+# first) finds the longest keyword starting at each match position; the
+# keywords it contains (e.g. 'refus' inside 'refusé') are credited from
+# _INDICATOR_WITHIN. No lookahead, so RE2 can run it too.
+_INDICATOR_RE = regex_engine.compile('|'.join(
+    map(re.escape, sorted(_INDICATOR_SLOTS, key=len, reverse=True))
+))
+_INDICATOR_WITHIN = {
+    word: tuple(other for other in _INDICATOR_SLOTS if other in word)
+    for word in _INDICATOR_SLOTS
+}
+
+
+# Openings for interview replies when no contact name is known
+_SALUTATIONS = (
+    "Bonjour,\n\n",
+    "Madame, Monsieur,\n\n",
+    "Bonjour à vous,\n\n"
+)
+
+# Reply templates, parsed once; filled with the job title, then followed by
+# the user's signature
+_INTERVIEW_TEMPLATE = Template("""${salutation}Je vous remercie pour votre retour concernant ma candidature pour le poste de $job_title.
+
+Je suis disponible pour un entretien aux créneaux suivants :
+- $first_slot
+- $second_slot
+
+N'hésitez pas à me proposer d'autres créneaux si ceux-ci ne vous conviennent pas.
+
+Je reste à votre disposition pour tout complément d'information.
+
+Cordialement,
+""")
+
+_FOLLOW_UP_TEMPLATE = Template("""Bonjour,
+
+Je vous remercie pour votre retour concernant ma candidature pour le poste de $job_title.
+
+Je me tiens à votre disposition pour toute information complémentaire concernant mon profil ou mon expérience.
+
+Dans l'attente de votre retour, je vous prie d'agréer, Madame, Monsieur, mes salutations distinguées.
+
+""")
+
+_REJECTION_TEMPLATE = Template("""Bonjour,
+
+Je vous remercie d'avoir pris le temps d'examiner ma candidature pour le poste de $job_title.
+
+Bien que déçu de ne pas être retenu pour ce poste, je reste intéressé par les opportunités futures au sein de votre entreprise. Je vous serais reconnaissant de bien vouloir me faire part des raisons de cette décision, afin que je puisse améliorer ma candidature pour de futures opportunités.
+
+Je vous remercie par avance pour votre retour et vous prie d'agréer, Madame, Monsieur, mes salutations distinguées.
+
+""")
+
+_INFO_TEMPLATE = Template("""Bonjour,
+
+Je vous remercie pour votre intérêt pour ma candidature au poste de $job_title.
+
+Je me permets de vous transmettre les informations complémentaires suivantes concernant mon profil :
+
+- [Détails sur l'expérience pertinente]
+- [Informations sur les compétences demandées]
+- [Disponibilités]
+- [Prétentions salariales si demandées]
+
+Je reste à votre disposition pour toute information complémentaire ou pour échanger plus en détail sur cette opportunité.
+
+Cordialement,
+""")
+
+_GENERIC_TEMPLATE = Template("""Bonjour,
+
+Je vous remercie pour votre message concernant ma candidature pour le poste de $job_title.
+
+Je vous prie de bien vouloir m'excuser, mais je souhaiterais obtenir des précisions sur votre demande afin de pouvoir y répondre de la manière la plus appropriée.
+
+Je reste à votre disposition pour tout complément d'information.
+
+Cordialement,
+""")
+
+
+# Next steps suggested with each kind of reply
+_INTERVIEW_STEPS = (
+    'Confirm availability for interview',
+    'Prepare questions about the role and company',
+    'Research the interviewers (if provided)'
+)
+_FOLLOW_UP_STEPS = (
+    'Send a thank you email',
+    'Follow up on next steps',
+    'Prepare additional information about your experience'
+)
+_REJECTION_STEPS = (
+    'Send a polite thank you email',
+    'Ask for feedback on your application',
+    'Request to be considered for future opportunities'
+)
+_INFO_STEPS = (
+    'Prepare detailed information about the requested topics',
+    'Update your resume or portfolio if needed',
+    'Follow up after sending the information'
+)
+_UNKNOWN_STEPS = (
+    'Review the email carefully',
+    'Consider forwarding to a human for review',
+    'Prepare a polite request for clarification'
+)
+
+
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class AnalyzeResult:
+    """
+    Outcome of analyze_response
+    
+    Also reads like the dict it replaced (result['action'],
+    result.get('contacts', []), result.items()); contacts only show up there
+    when some were found.
+    """
+    action: str
+    confidence: float
+    next_steps: Tuple[str, ...]
+    suggested_response: str
+    contacts: Tuple[Dict, ...] = ()
+    
+    def items(self):
+        fields = [
+            ('action', self.action),
+            ('confidence', self.confidence),
+            ('next_steps', self.next_steps),
+            ('suggested_response', self.suggested_response),
+        ]
+        if self.contacts:
+            fields.append(('contacts', self.contacts))
+        return fields
+    
+    def keys(self):
+        return [key for key, _ in self.items()]
+    
+    def get(self, key: str, default=None):
+        if key == 'contacts' and not self.contacts:
+            return default
+        return getattr(self, key, default) if key in self.__dataclass_fields__ else default
+    
+    def __getitem__(self, key: str):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+
+class _NoContacts(Exception):
+    """Raised inside the cached lookup so lru_cache skips empty results"""
+
+
+@lru_cache(maxsize=1024)
+def _cached_contacts(company: str) -> tuple:
+    # Imported here: only interview replies look up contacts (pulls in requests/bs4)
+    from email_finder import EmailFinder
+    
+    finder = EmailFinder(company_name=company)
+    found = finder.find_all_contacts()
+    
+    # Try to find RHE (Responsable Hygiène et Sécurité), then Site Manager/Chef de Chantier
+    contacts = tuple(
+        tuple(contact.items())
+        for contact in (found['rhe'], found['site_manager'])
+        if contact
+    )
+    if not contacts:
+        raise _NoContacts(company)
+    return contacts
+
+
+def _contacts_for(company: str) -> tuple:
+    """Contacts found for a company, memoized (each lookup scrapes the web);
+    contacts are item tuples so callers copy them into fresh dicts. Empty
+    results are not cached, so a company is looked up again next time"""
+    try:
+        return _cached_contacts(company)
+    except _NoContacts:
+        return ()
+
 
 class ResponseHandler:
+    # Built once per process and shared by every handler: a Hyperscan database
+    # when available, else an Aho-Corasick automaton
+    _indicator_db = _build_indicator_db()
+    _indicator_automaton = _build_indicator_automaton() if _indicator_db is None else None
+    
+    # Handler for each analyze_response key (interview, positive, negative,
+    # info bits, highest first); the highest set bit decides
+    _DECISIONS = tuple(
+        '_handle_interview_request' if key & 8 else
+        '_handle_positive_response' if key & 4 else
+        '_handle_rejection' if key & 2 else
+        '_handle_information_request' if key & 1 else
+        '_handle_unknown_response'
+        for key in range(16)
+    )
+    
+    # Interview times offered: (days from today, format)
+    _SLOT_SPECS = (
+        (2, "lundi %d/%m entre 9h et 12h"),
+        (3, "mardi %d/%m entre 14h et 17h"),
+        (4, "mercredi %d/%m entre 10h et 16h"),
+        (5, "jeudi %d/%m entre 9h et 18h"),
+    )
+    
     def __init__(self, job_data: Dict, user_profile: Dict):
         self.job_data = job_data
         self.user_profile = user_profile
         self.company_name = job_data.get('company', '')
         self.job_title = job_data.get('title', '')
         self.response_plan = []
+        
+        # Signature closing every reply, built once (no phone on rejections)
+        name = f"{user_profile.get('first_name', '')} {user_profile.get('last_name', '')}"
+        self._signature = f"{name}\n{user_profile.get('phone', '')}\n{user_profile.get('email', '')}\n"
+        self._signature_no_phone = f"{name}\n{user_profile.get('email', '')}\n"
+        self._slot_pool = None
     
-    def analyze_response(self, email_text: str) -> Dict:
+    def analyze_response(self, email_text: str) -> AnalyzeResult:
         """
         Analyze the response email and determine the appropriate action
-        Returns: {
-            'action': 'follow_up'|'send_info'|'schedule_interview'|'rejection'|'unknown',
-            'confidence': float (0-1),
-            'next_steps': List[str],
-            'suggested_response': str
-        }
+        Returns: AnalyzeResult(
+            action='follow_up'|'send_info'|'schedule_interview'|'rejection'|'unknown',
+            confidence=float (0-1),
+            next_steps=Tuple[str, ...],
+            suggested_response=str,
+            contacts=Tuple[Dict, ...] (interview requests only)
+        )
         """
-        email_text = email_text.lower()
-        
-        # Check for common positive responses
-        positive_indicators = [
-            'intéressé', 'intéressée', 'intéressant', 'souhaitez-vous', 'disponible',
-            'entretien', 'rencontrer', 'convoquer', 'disponibilité', 'parler',
-            'téléphone', 'appel', 'zoom', 'teams', 'meet', 'visio',
-            'expérience', 'cv', 'curriculum vitae', 'parcours',
-            'poste', 'mission', 'profil', 'candidature'
-        ]
-        
-        # Check for negative responses
-        negative_indicators = [
-            'ne correspond pas', 'pas retenu', 'pas sélectionné', 'malheureusement',
-            'candidature retenue', 'poste pourvu', 'plus avancer', 'ne correspond pas',
-            'pas le profil', 'pas d\'opportunité', 'pas d\'ouverture', 'pas de poste',
-            'rester en contact', 'prochaine opportunité', 'candidature future',
-            'refus', 'refuser', 'décliné', 'décliner', 'refusé'
-        ]
-        
-        # Check for information requests
-        info_requests = [
-            'plus d\'information', 'plus de détails', 'précision', 'préciser',
-            'questions', 'renseignement', 'savoir plus', 'en savoir plus',
-            'disponible', 'expérience', 'compétence', 'formation', 'diplôme',
-            'rémunération', 'salaire', 'prétention salariale', 'prétention',
-            'début', 'disponibilité', 'mobile', 'télétravail', 'présentiel',
-            'permis', 'véhicule', 'déplacement', 'mobilité'
-        ]
-        
-        # Calculate scores
-        positive_score = sum(1 for word in positive_indicators if word in email_text)
-        negative_score = sum(1 for word in negative_indicators if word in email_text)
-        info_score = sum(1 for word in info_requests if word in email_text)
-        
-        # Determine the most likely action
-        if positive_score > 0 and positive_score > negative_score:
-            if any(word in email_text for word in ['entretien', 'rencontre', 'rencontrer', 'disponible']):
-                return self._handle_interview_request()
-            return self._handle_positive_response()
-        
-        elif negative_score > 0:
-            return self._handle_rejection()
-        
-        elif info_score > 2:
-            return self._handle_information_request()
+        return getattr(self, self._decide(email_text))()
+    
+    @classmethod
+    def _decide(cls, email_text: str) -> str:
+        """Name of the handler for an email"""
+        # Calculate scores (the same scan picks up any interview wording)
+        (positive_score, negative_score, info_score), found = cls._indicator_scores(_fold(email_text))
         
+        # Determine the most likely action: pack the tests into a key and look
+        # the handler up in the decision table. Interview wording only matters
+        # for positive replies, and is then a set check on the words found.
+        positive = positive_score > 0 and positive_score > negative_score
+        interview = positive and not _INTERVIEW_KEYS.isdisjoint(found)
+        key = interview << 3 | positive << 2 | (negative_score > 0) << 1 | (info_score > 2)
+        return cls._DECISIONS[key]
+    
+    @classmethod
+    def _indicator_scores(cls, email_text: str) -> Tuple[List[int], Set[str]]:
+        """Count the indicators of each kind occurring in the (folded) text; also
+        return the keywords found (interview words included)"""
+        # One pass over the text finds every keyword; each counts once however
+        # often it occurs
+        db, automaton = cls._indicator_db, cls._indicator_automaton
+        if db is not None:
+            found = set()
+            
+            def on_match(word_id, start, end, flags, context):
+                found.add(_INDICATOR_WORDS[word_id])
+            
+            # Byte-level literals; 'ignore' only drops stray surrogates from
+            # badly decoded mail
+            db.scan(email_text.encode('utf-8', 'ignore'), match_event_handler=on_match)
+        elif automaton is not None:
+            found = {word for _, word in automaton.iter(email_text)}
         else:
-            return self._handle_unknown_response()
+            # Resume one character after each match start so overlapping
+            # keywords (e.g. 'savoir plus' / 'plus avancer') are all seen
+            found = set()
+            pos = 0
+            while True:
+                match = _INDICATOR_RE.search(email_text, pos)
+                if match is None:
+                    break
+                found.update(_INDICATOR_WITHIN[match.group()])
+                pos = match.start() + 1
+        
+        # One counter loop over the slots of every keyword found
+        scores = [0, 0, 0]
+        for slot in chain.from_iterable(map(_INDICATOR_SLOTS.__getitem__, found)):
+            scores[slot] += 1
+        return scores, found
     
-    def _handle_interview_request(self) -> Dict:
+    def _handle_interview_request(self) -> AnalyzeResult:
         """Handle interview scheduling requests"""
         # Try to find the best contact for scheduling
         contacts = self._find_company_contacts()
         
-        response = {
-            'action': 'schedule_interview',
-            'confidence': 0.9,
-            'next_steps': [
-                'Confirm availability for interview',
-                'Prepare questions about the role and company',
-                'Research the interviewers (if provided)'
-            ],
-            'suggested_response': self._generate_interview_response(contacts)
-        }
-        
-        if contacts:
-            response['contacts'] = contacts
-        
-        return response
+        return AnalyzeResult(
+            action='schedule_interview',
+            confidence=0.9,
+            next_steps=_INTERVIEW_STEPS,
+            suggested_response=self._generate_interview_response(contacts),
+            contacts=tuple(contacts)
+        )
     
-    def _handle_positive_response(self) -> Dict:
+    def _handle_positive_response(self) -> AnalyzeResult:
         """Handle positive but non-interview responses"""
-        return {
-            'action': 'follow_up',
-            'confidence': 0.8,
-            'next_steps': [
-                'Send a thank you email',
-                'Follow up on next steps',
-                'Prepare additional information about your experience'
-            ],
-            'suggested_response': self._generate_follow_up_response()
-        }
+        return AnalyzeResult(
+            action='follow_up',
+            confidence=0.8,
+            next_steps=_FOLLOW_UP_STEPS,
+            suggested_response=self._generate_follow_up_response()
+        )
     
-    def _handle_rejection(self) -> Dict:
+    def _handle_rejection(self) -> AnalyzeResult:
         """Handle rejection emails"""
-        return {
-            'action': 'rejection',
-            'confidence': 0.85,
-            'next_steps': [
-                'Send a polite thank you email',
-                'Ask for feedback on your application',
-                'Request to be considered for future opportunities'
-            ],
-            'suggested_response': self._generate_rejection_response()
-        }
+        return AnalyzeResult(
+            action='rejection',
+            confidence=0.85,
+            next_steps=_REJECTION_STEPS,
+            suggested_response=self._generate_rejection_response()
+        )
     
-    def _handle_information_request(self) -> Dict:
+    def _handle_information_request(self) -> AnalyzeResult:
         """Handle requests for more information"""
-        return {
-            'action': 'send_info',
-            'confidence': 0.9,
-            'next_steps': [
-                'Prepare detailed information about the requested topics',
-                'Update your resume or portfolio if needed',
-                'Follow up after sending the information'
-            ],
-            'suggested_response': self._generate_info_response()
-        }
+        return AnalyzeResult(
+            action='send_info',
+            confidence=0.9,
+            next_steps=_INFO_STEPS,
+            suggested_response=self._generate_info_response()
+        )
     
-    def _handle_unknown_response(self) -> Dict:
+    def _handle_unknown_response(self) -> AnalyzeResult:
         """Handle unrecognized responses"""
-        return {
-            'action': 'unknown',
-            'confidence': 0.5,
-            'next_steps': [
-                'Review the email carefully',
-                'Consider forwarding to a human for review',
-                'Prepare a polite request for clarification'
-            ],
-            'suggested_response': self._generate_generic_response()
-        }
+        return AnalyzeResult(
+            action='unknown',
+            confidence=0.5,
+            next_steps=_UNKNOWN_STEPS,
+            suggested_response=self._generate_generic_response()
+        )
     
     def _find_company_contacts(self) -> List[Dict]:
-        """Find relevant contacts at the company"""
-        finder = EmailFinder(company_name=self.company_name)
-        contacts = []
-        
-        # Try to find RHE (Responsable Hygiène et Sécurité)
-        rhe = finder.find_rhe_contact()
-        if rhe:
-            contacts.append(rhe)
-        
-        # Try to find Site Manager/Chef de Chantier
-        site_manager = finder.find_site_manager_contact()
-        if site_manager:
-            contacts.append(site_manager)
-        
-        return contacts
+        """Find relevant contacts at the company (looked up once per company)"""
+        return [dict(contact) for contact in _contacts_for(self.company_name)]
     
     def _generate_interview_response(self, contacts: List[Dict] = None) -> str:
         """Generate a response to an interview request"""
-        salutations = [
-            f"Bonjour,\n\n",
-            f"Madame, Monsieur,\n\n",
-            f"Bonjour à vous,\n\n"
-        ]
+        import random
         
         # Add contact name if available
-        if contacts and len(contacts) > 0:
-            contact = contacts[0]
-            salutation = f"Bonjour {contact.get('name', '').split(' ')[0] if contact.get('name') else ''},\n\n"
+        if contacts:
+            name = contacts[0].get('name')
+            salutation = f"Bonjour {name.split(' ')[0] if name else ''},\n\n"
         else:
-            salutation = random.choice(salutations)
-        
-        # Generate available times
-        today = datetime.now()
-        time_slots = [
-            (today + timedelta(days=2)).strftime("lundi %d/%m entre 9h et 12h"),
-            (today + timedelta(days=3)).strftime("mardi %d/%m entre 14h et 17h"),
-            (today + timedelta(days=4)).strftime("mercredi %d/%m entre 10h et 16h"),
-            (today + timedelta(days=5)).strftime("jeudi %d/%m entre 9h et 18h")
-        ]
+            salutation = random.choice(_SALUTATIONS)
         
-        selected_slots = random.sample(time_slots, 2)
+        # Pick two of the available times
+        time_slots = self._time_slots()
+        first, second = random.sample(range(len(time_slots)), 2)
         
-        response = f"""{salutation}Je vous remercie pour votre retour concernant ma candidature pour le poste de {self.job_title}.
-
-Je suis disponible pour un entretien aux créneaux suivants :
-- {selected_slots[0]}
-- {selected_slots[1]}
-
-N'hésitez pas à me proposer d'autres créneaux si ceux-ci ne vous conviennent pas.
-
-Je reste à votre disposition pour tout complément d'information.
-
-Cordialement,
-{self.user_profile.get('first_name', '')} {self.user_profile.get('last_name', '')}
-{self.user_profile.get('phone', '')}
-{self.user_profile.get('email', '')}
-"""
-        return response
+        response = _INTERVIEW_TEMPLATE.substitute(
+            salutation=salutation,
+            job_title=self.job_title,
+            first_slot=time_slots[first],
+            second_slot=time_slots[second]
+        )
+        return response + self._signature
+    
+    def _time_slots(self) -> Tuple[str, ...]:
+        """Available times to offer, formatted once per handler"""
+        if self._slot_pool is None:
+            today = datetime.now()
+            self._slot_pool = tuple(
+                (today + timedelta(days=days)).strftime(fmt)
+                for days, fmt in self._SLOT_SPECS
+            )
+        return self._slot_pool
     
     def _generate_follow_up_response(self) -> str:
         """Generate a follow-up response"""
-        return f"""Bonjour,
-
-Je vous remercie pour votre retour concernant ma candidature pour le poste de {self.job_title}.
-
-Je me tiens à votre disposition pour toute information complémentaire concernant mon profil ou mon expérience.
-
-Dans l'attente de votre retour, je vous prie d'agréer, Madame, Monsieur, mes salutations distinguées.
-
-{self.user_profile.get('first_name', '')} {self.user_profile.get('last_name', '')}
-{self.user_profile.get('phone', '')}
-{self.user_profile.get('email', '')}
-"""
+        return _FOLLOW_UP_TEMPLATE.substitute(job_title=self.job_title) + self._signature
     
     def _generate_rejection_response(self) -> str:
         """Generate a response to a rejection"""
-        return f"""Bonjour,
-
-Je vous remercie d'avoir pris le temps d'examiner ma candidature pour le poste de {self.job_title}.
-
-Bien que déçu de ne pas être retenu pour ce poste, je reste intéressé par les opportunités futures au sein de votre entreprise. Je vous serais reconnaissant de bien vouloir me faire part des raisons de cette décision, afin que je puisse améliorer ma candidature pour de futures opportunités.
-
-Je vous remercie par avance pour votre retour et vous prie d'agréer, Madame, Monsieur, mes salutations distinguées.
-
-{self.user_profile.get('first_name', '')} {self.user_profile.get('last_name', '')}
-{self.user_profile.get('email', '')}
-"""
+        return _REJECTION_TEMPLATE.substitute(job_title=self.job_title) + self._signature_no_phone
     
     def _generate_info_response(self) -> str:
         """Generate a response to an information request"""
-        return f"""Bonjour,
-
-Je vous remercie pour votre intérêt pour ma candidature au poste de {self.job_title}.
-
-Je me permets de vous transmettre les informations complémentaires suivantes concernant mon profil :
-
-- [Détails sur l'expérience pertinente]
-- [Informations sur les compétences demandées]
-- [Disponibilités]
-- [Prétentions salariales si demandées]
-
-Je reste à votre disposition pour toute information complémentaire ou pour échanger plus en détail sur cette opportunité.
-
-Cordialement,
-{self.user_profile.get('first_name', '')} {self.user_profile.get('last_name', '')}
-{self.user_profile.get('phone', '')}
-{self.user_profile.get('email', '')}
-"""
+        return _INFO_TEMPLATE.substitute(job_title=self.job_title) + self._signature
     
     def _generate_generic_response(self) -> str:
         """Generate a generic response for unknown email types"""
-        return f"""Bonjour,
-
-Je vous remercie pour votre message concernant ma candidature pour le poste de {self.job_title}.
-
-Je vous prie de bien vouloir m'excuser, mais je souhaiterais obtenir des précisions sur votre demande afin de pouvoir y répondre de la manière la plus appropriée.
-
-Je reste à votre disposition pour tout complément d'information.
-
-Cordialement,
-{self.user_profile.get('first_name', '')} {self.user_profile.get('last_name', '')}
-{self.user_profile.get('phone', '')}
-{self.user_profile.get('email', '')}
-"""
+        return _GENERIC_TEMPLATE.substitute(job_title=self.job_title) + self._signature
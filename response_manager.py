@@ -3,18 +3,33 @@ Response Manager - Handles incoming responses and manages follow-ups
 """
 
 import os
+import re
 import logging
 import imaplib
 import email
-from email.header import decode_header
-from typing import Dict, List, Optional
+from email import policy
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup
 from email_finder import EmailFinder
 from response_handler import ResponseHandler
 from email_templates import EmailTemplates
 from email_notifier import EmailNotifier
 from job_database import JobDatabase
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# C-based lxml is far faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +41,150 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Header fields needed for triage, plus the MIME fields required to parse the body
+FETCH_HEADER_FIELDS = 'FROM SUBJECT DATE MIME-VERSION CONTENT-TYPE CONTENT-TRANSFER-ENCODING'
+# Only the start of each body is ever matched against or forwarded
+FETCH_BODY_BYTES = 4096
+# Jobs whose emails are handled concurrently; each waits on contact lookups and SMTP
+MAX_CONCURRENT_JOBS = 4
+FETCH_QUERY = f'(BODY.PEEK[HEADER.FIELDS ({FETCH_HEADER_FIELDS})] BODY.PEEK[TEXT]<0.{FETCH_BODY_BYTES}>)'
+
+# Notifications sent to the user; filled in with str.format
+_INFO_REQUEST_TEMPLATE = """Bonjour,
+
+Vous avez reçu une demande d'information concernant votre candidature pour le poste de {job_title} chez {company}.
+
+Détails de la demande :
+- Poste : {job_title}
+- Entreprise : {company}
+- Date de candidature : {applied_date}
+
+Message reçu :
+{email_body}
+
+---
+
+Voici une suggestion de réponse que vous pouvez utiliser :
+
+{suggested_response}
+
+---
+
+Veuillez répondre directement à cet email avec votre réponse ou les informations demandées.
+
+Cordialement,
+Votre assistant de recherche d'emploi
+"""
+
+_REJECTION_TEMPLATE = """Bonjour,
+
+Nous avons reçu une mise à jour concernant votre candidature pour le poste de {job_title} chez {company}.
+
+Statut : ❌ Non retenu(e)
+
+Message reçu :
+{email_body}
+
+---
+
+Voici une suggestion de réponse de remerciement que vous pouvez utiliser :
+
+{suggested_response}
+
+---
+
+Nous continuons à surveiller d'autres opportunités pour vous.
+
+Cordialement,
+Votre assistant de recherche d'emploi
+"""
+
+_UNKNOWN_RESPONSE_TEMPLATE = """Bonjour,
+
+Nous avons reçu une réponse concernant votre candidature pour le poste de {job_title} chez {company}, mais nous n'avons pas pu déterminer automatiquement la meilleure façon de la traiter.
+
+Détails de la candidature :
+- Poste : {job_title}
+- Entreprise : {company}
+- Date de candidature : {applied_date}
+
+Message reçu :
+{email_body}
+
+---
+
+Notre analyse indique :
+{analysis}
+
+---
+
+Veuillez examiner ce message et prendre les mesures appropriées.
+
+Cordialement,
+Votre assistant de recherche d'emploi
+"""
+
+
+class RecentJobIndex:
+    """Recent applications indexed by lowercased company name and reference"""
+    
+    def __init__(self, jobs: List[Dict]):
+        self.jobs = jobs
+        
+        # Lowercased (company, title, reference) of each job, computed once
+        self.lowered = [
+            tuple((job.get(field) or '').lower() for field in ('company', 'title', 'reference'))
+            for job in jobs
+        ]
+        
+        # Every key maps to the positions of the jobs it belongs to, so
+        # candidates can be checked in the original (most recent first) order
+        self._positions: Dict[str, List[int]] = {}
+        for position, (company, _, ref) in enumerate(self.lowered):
+            for key in (company, ref):
+                if key:
+                    self._positions.setdefault(key, []).append(position)
+        
+        self._automaton = self._pattern = None
+        if not self._positions:
+            return
+        
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for key in self._positions:
+                self._automaton.add_word(key, key)
+            self._automaton.make_automaton()
+        else:
+            # Longest key first; keys nested inside a match are added via _within
+            self._pattern = re.compile('|'.join(
+                map(re.escape, sorted(self._positions, key=len, reverse=True))
+            ))
+            self._within = {
+                key: tuple(other for other in self._positions if other in key)
+                for key in self._positions
+            }
+    
+    def candidates(self, text: str) -> List[Tuple[Dict, Tuple[str, str, str]]]:
+        """
+        Jobs whose company or reference occurs in the (lowercased) text, in
+        order, each paired with its lowercased (company, title, reference)
+        """
+        found = set()
+        if self._automaton is not None:
+            found.update(key for _, key in self._automaton.iter(text))
+        elif self._pattern is not None:
+            pos = 0
+            while True:
+                match = self._pattern.search(text, pos)
+                if match is None:
+                    break
+                found.update(self._within[match.group()])
+                pos = match.start() + 1
+        
+        positions = sorted({position for key in found for position in self._positions[key]})
+        return [(self.jobs[position], self.lowered[position]) for position in positions]
+
+
 class ResponseManager:
     def __init__(self, config: Dict, db_path: str = 'job_hunter.db'):
         """
@@ -47,6 +206,8 @@ class ResponseManager:
             from_email=config['email']['from_email'],
             from_name=config['email']['from_name']
         )
+        # IMAP connection kept open between polls (see _imap_connection)
+        self._mail = None
         
     def fetch_new_emails(self) -> List[Dict]:
         """
@@ -58,19 +219,7 @@ class ResponseManager:
         emails = []
         
         try:
-            # Connect to IMAP server
-            logger.info(f"Connecting to IMAP server: {self.imap_server}:{self.imap_port}")
-            mail = imaplib.IMAP4_SSL(self.imap_server, self.imap_port)
-            
-            # Login
-            mail.login(
-                self.config['email']['smtp_username'],
-                self.config['email']['smtp_password']
-            )
-            logger.info("Successfully logged in to email account")
-            
-            # Select inbox
-            mail.select('inbox')
+            mail = self._imap_connection()
             
             # Search for unread emails
             _, message_numbers = mail.search(None, 'UNSEEN')
@@ -78,26 +227,23 @@ class ResponseManager:
             
             logger.info(f"Found {len(email_ids)} unread emails")
             
-            # Process last 10 unread emails
-            for email_id in email_ids[-10:]:
+            # Fetch headers and the start of the body of the last 10 unread
+            # emails in a single round-trip; PEEK leaves them unread
+            seen_ids = []
+            for email_id, email_body in self._fetch_messages(mail, email_ids[-10:], FETCH_QUERY):
                 try:
-                    _, msg_data = mail.fetch(email_id, '(RFC822)')
-                    email_body = msg_data[0][1]
-                    email_message = email.message_from_bytes(email_body)
+                    email_message = email.message_from_bytes(email_body, policy=policy.default)
                     
                     # Extract sender
                     from_email = email_message['From']
                     if '<' in from_email:
                         from_email = from_email.split('<')[1].split('>')[0]
                     
-                    # Extract subject
+                    # Extract subject (encoded words are decoded by the policy,
+                    # with every chunk in its own charset)
                     subject = email_message['Subject']
                     if subject:
-                        decoded_subject = decode_header(subject)[0]
-                        if isinstance(decoded_subject[0], bytes):
-                            subject = decoded_subject[0].decode(decoded_subject[1] or 'utf-8')
-                        else:
-                            subject = decoded_subject[0]
+                        subject = str(subject)
                     
                     # Extract body
                     body = self._get_email_body(email_message)
@@ -109,51 +255,149 @@ class ResponseManager:
                         'from_email': from_email,
                         'subject': subject or '',
                         'body': body,
+                        # Slices quoted by the notification handlers
+                        'body_preview_500': body[:500],
+                        'body_preview_1000': body[:1000],
                         'received_date': received_date
                     })
                     
+                    seen_ids.append(email_id)
+                    
                     logger.info(f"Processed email from {from_email}: {subject}")
                     
                 except Exception as e:
                     logger.error(f"Error processing email {email_id}: {e}")
                     continue
             
-            # Close connection
-            mail.close()
-            mail.logout()
+            # Only mark emails as read once they have been parsed, so that
+            # failures are retried on the next poll
+            if seen_ids:
+                mail.store(b','.join(seen_ids), '+FLAGS', '\\Seen')
             
         except Exception as e:
             logger.error(f"Error fetching emails: {e}")
+            # Start from a fresh connection on the next poll
+            self.close_connection()
         
         return emails
     
+    def _imap_connection(self):
+        """
+        Return the IMAP connection, reusing the one from the previous poll
+        while the server still answers NOOP
+        """
+        if self._mail is not None:
+            try:
+                self._mail.noop()
+                return self._mail
+            except (imaplib.IMAP4.error, OSError) as e:
+                logger.info(f"IMAP connection lost, reconnecting: {e}")
+                self._mail = None
+        
+        # Connect to IMAP server
+        logger.info(f"Connecting to IMAP server: {self.imap_server}:{self.imap_port}")
+        mail = imaplib.IMAP4_SSL(self.imap_server, self.imap_port)
+        
+        # Login
+        mail.login(
+            self.config['email']['smtp_username'],
+            self.config['email']['smtp_password']
+        )
+        logger.info("Successfully logged in to email account")
+        
+        # Select inbox
+        mail.select('inbox')
+        
+        self._mail = mail
+        return mail
+    
+    def close_connection(self):
+        """
+        Log out of the IMAP server if connected
+        
+        The connection outlives fetch_new_emails so repeated polls on the same
+        manager reuse it; call this once the caller is done polling.
+        """
+        mail, self._mail = self._mail, None
+        if mail is None:
+            return
+        
+        try:
+            mail.close()
+            mail.logout()
+        except (imaplib.IMAP4.error, OSError):
+            pass
+    
+    def _fetch_messages(self, mail, email_ids: List[bytes], query: str) -> List[Tuple[bytes, bytes]]:
+        """
+        Fetch several messages with one FETCH command
+        
+        Falls back to splitting the id set in halves when the server rejects
+        the request as too large.
+        
+        Returns:
+            List of (email_id, data) tuples in server order, where data joins
+            the header literals of a message followed by its other literals
+        """
+        if not email_ids:
+            return []
+        
+        try:
+            _, msg_data = mail.fetch(b','.join(email_ids), query)
+        except imaplib.IMAP4.error as e:
+            if len(email_ids) == 1 or 'maximum request size' not in str(e):
+                raise
+            middle = len(email_ids) // 2
+            return (self._fetch_messages(mail, email_ids[:middle], query) +
+                    self._fetch_messages(mail, email_ids[middle:], query))
+        
+        # Each message comes back as one (prefix, literal) tuple per fetched
+        # section followed by b')'; only the first prefix carries the id
+        messages = []
+        for item in msg_data:
+            if not isinstance(item, tuple):
+                continue
+            prefix, literal = item
+            if prefix[:1].isdigit():
+                messages.append((prefix.split()[0], [], []))
+            headers, others = messages[-1][1], messages[-1][2]
+            (headers if b'HEADER' in prefix else others).append(literal)
+        
+        return [(email_id, b''.join(headers + others)) for email_id, headers, others in messages]
+    
     def _get_email_body(self, email_message) -> str:
         """
         Extract the body text from an email message
+        
+        Prefers the text/plain body, falling back to the text of the
+        text/html body (also when a long HTML part first in the message cut
+        the plain one off the partial fetch); attachment parts are never
+        decoded.
         """
-        body = ""
+        part = email_message.get_body(preferencelist=('plain', 'html'))
+        if part is None:
+            return ''
         
-        if email_message.is_multipart():
-            for part in email_message.walk():
-                content_type = part.get_content_type()
-                content_disposition = str(part.get("Content-Disposition"))
-                
-                # Get text/plain parts
-                if content_type == "text/plain" and "attachment" not in content_disposition:
-                    try:
-                        body = part.get_payload(decode=True).decode()
-                        break
-                    except:
-                        pass
-        else:
-            # Not multipart - get payload directly
-            try:
-                body = email_message.get_payload(decode=True).decode()
-            except:
-                body = str(email_message.get_payload())
+        # Decode with the declared charset; undecodable bytes become U+FFFD
+        payload = part.get_payload(decode=True) or b''
+        try:
+            body = payload.decode(part.get_content_charset() or 'utf-8', errors='replace')
+        except LookupError:
+            # Unknown charset label
+            body = payload.decode('utf-8', errors='replace')
         
+        if part.get_content_type() == 'text/html':
+            body = self._html_to_text(body)
         return body
     
+    @staticmethod
+    def _html_to_text(html: str) -> str:
+        """Visible text of a (possibly truncated) HTML body"""
+        soup = BeautifulSoup(html, HTML_PARSER)
+        for tag in soup(['script', 'style', 'head']):
+            tag.decompose()
+        return soup.get_text(' ', strip=True)
+    
     def check_and_process_responses(self):
         """
         Main method to check for new emails and process all responses
@@ -169,18 +413,49 @@ class ResponseManager:
         
         logger.info(f"Processing {len(emails)} new emails")
         
-        # Process each email
-        for email_data in emails:
+        # Load and index recent applications once for the whole batch
+        job_index = RecentJobIndex(self.db.get_recent_applications(days=30))
+        
+        # Match every email to its application first, then handle the emails
+        # of different jobs concurrently so their network waits overlap. One
+        # worker takes all emails about a job, in fetch order, so the latest
+        # one still decides its status. Replies and notifications reuse the
+        # SMTP session, which connects once per worker on its first send.
+        results: List = [None] * len(emails)
+        groups: Dict = {}
+        for position, email_data in enumerate(emails):
             try:
-                result = self.process_incoming_email(email_data)
-                logger.info(f"Email processed: {result.get('status')}")
+                job_data = self._find_related_job(email_data, job_index)
             except Exception as e:
-                logger.error(f"Error processing email: {e}")
+                results[position] = e
                 continue
+            key = job_data.get('job_id') if job_data else ('unmatched', position)
+            groups.setdefault(key, []).append((position, email_data, job_data))
+        
+        def handle_group(group: List[Tuple[int, Dict, Optional[Dict]]]) -> List[Tuple[int, object]]:
+            handled = []
+            for position, email_data, job_data in group:
+                try:
+                    handled.append((position, self._respond_to_email(email_data, job_data)))
+                except Exception as e:
+                    handled.append((position, e))
+            return handled
+        
+        with self.email_notifier.session():
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_JOBS) as executor:
+                for handled in executor.map(handle_group, groups.values()):
+                    for position, result in handled:
+                        results[position] = result
+        
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error processing email: {result}")
+            else:
+                logger.info(f"Email processed: {result.get('status')}")
         
         logger.info("Email response check complete")
     
-    def process_incoming_email(self, email_data: Dict) -> Dict:
+    def process_incoming_email(self, email_data: Dict, job_index: Optional[RecentJobIndex] = None) -> Dict:
         """
         Process an incoming email and determine the appropriate action
         
@@ -191,11 +466,17 @@ class ResponseManager:
                 - body: Email body text
                 - received_date: When the email was received
                 - job_id: Optional job ID if this is related to an application
+            job_index: Index of recent applications to match against; built
+                from the database when not given
         """
+        # Try to find the related job application
+        job_data = self._find_related_job(email_data, job_index)
+        return self._respond_to_email(email_data, job_data)
+    
+    def _respond_to_email(self, email_data: Dict, job_data: Optional[Dict]) -> Dict:
+        """Analyze an email already matched to its job (if any) and act on it"""
         logger.info(f"Processing email from {email_data.get('from_email')} with subject: {email_data.get('subject')}")
         
-        # Try to find the related job application
-        job_data = self._find_related_job(email_data)
         if not job_data:
             logger.warning("No related job found for this email")
             return {'status': 'error', 'message': 'No related job found'}
@@ -222,12 +503,13 @@ class ResponseManager:
             'result': result
         }
     
-    def _find_related_job(self, email_data: Dict) -> Optional[Dict]:
+    def _find_related_job(self, email_data: Dict, job_index: Optional[RecentJobIndex] = None) -> Optional[Dict]:
         """
         Find the job related to this email
         
         Args:
             email_data: Dictionary containing email data
+            job_index: Index of recent applications
             
         Returns:
             Job data as a dictionary or None if not found
@@ -242,14 +524,12 @@ class ResponseManager:
         subject = email_data.get('subject', '').lower()
         body = email_data.get('body', '').lower()
         
-        # Get recent applications (last 30 days)
-        recent_jobs = self.db.get_recent_applications(days=30)
+        # Get recent applications (last 30 days) unless the caller already has them
+        if job_index is None:
+            job_index = RecentJobIndex(self.db.get_recent_applications(days=30))
         
-        # Try to find a match
-        for job in recent_jobs:
-            company = job.get('company', '').lower()
-            title = job.get('title', '').lower()
-            
+        # Only jobs whose company or reference appears somewhere can match
+        for job, (company, title, ref) in job_index.candidates(subject + '\0' + body):
             # Check if company name is in subject or body
             if company and (company in subject or company in body):
                 # If we also have a job title, check for that too
@@ -257,13 +537,17 @@ class ResponseManager:
                     return job
             
             # Check for job reference numbers if present
-            if 'reference' in job and job['reference']:
-                ref = job['reference'].lower()
-                if ref in subject or ref in body:
-                    return job
+            if ref and (ref in subject or ref in body):
+                return job
         
         return None
     
+    @staticmethod
+    def _body_preview(email_data: Dict, length: int) -> str:
+        """First `length` characters of the body, precomputed by fetch_new_emails when available"""
+        preview = email_data.get(f'body_preview_{length}')
+        return preview if preview is not None else email_data.get('body', '')[:length]
+    
     def _handle_analysis_result(self, analysis: Dict, job_data: Dict, email_data: Dict) -> Dict:
         """
         Handle the result of email analysis
@@ -313,20 +597,22 @@ class ResponseManager:
         # Send the response
         subject = f"Disponibilités pour entretien - {job_data.get('title', 'Candidature')}"
         
-        # Use the template if available, otherwise use the suggested response
-        try:
-            template = EmailTemplates.get_template('interview_request', {
-                'job_title': job_data.get('title', ''),
-                'first_name': self.config['profile'].get('first_name', ''),
-                'last_name': self.config['profile'].get('last_name', ''),
-                'email': self.config['email'].get('from_email', ''),
-                'phone': self.config['profile'].get('phone', '')
-            })
-            subject = template['subject']
-            body = template['body']
-        except Exception as e:
-            logger.warning(f"Error loading email template: {e}")
-            body = suggested_response
+        # The suggested response proposes concrete time slots; only fall back
+        # to the template (which has none to offer here) without one
+        body = suggested_response
+        if not body:
+            try:
+                template = EmailTemplates.get_template('interview_request', {
+                    'job_title': job_data.get('title', ''),
+                    'first_name': self.config['profile'].get('first_name', ''),
+                    'last_name': self.config['profile'].get('last_name', ''),
+                    'email': self.config['email'].get('from_email', ''),
+                    'phone': self.config['profile'].get('phone', '')
+                })
+                subject = template['subject']
+                body = template['body']
+            except Exception as e:
+                logger.warning(f"Error loading email template: {e}")
         
         # Send the email
         try:
@@ -412,35 +698,11 @@ class ResponseManager:
         user_email = self.config['email'].get('from_email')
         subject = f"Action Requise: Réponse à une demande d'information - {job_data.get('title', '')}"
         
-        message = f"""Bonjour,
-
-Vous avez reçu une demande d'information concernant votre candidature pour le poste de {job_title} chez {company}.
-
-Détails de la demande :
-- Poste : {job_title}
-- Entreprise : {company}
-- Date de candidature : {applied_date}
-
-Message reçu :
-{email_body}
-
----
-
-Voici une suggestion de réponse que vous pouvez utiliser :
-
-{suggested_response}
-
----
-
-Veuillez répondre directement à cet email avec votre réponse ou les informations demandées.
-
-Cordialement,
-Votre assistant de recherche d'emploi
-""".format(
+        message = _INFO_REQUEST_TEMPLATE.format(
             job_title=job_data.get('title', ''),
             company=job_data.get('company', ''),
             applied_date=job_data.get('applied_date', ''),
-            email_body=email_data.get('body', '')[:500] + '...' if email_data.get('body') else '',
+            email_body=self._body_preview(email_data, 500) + '...' if email_data.get('body') else '',
             suggested_response=analysis.get('suggested_response', '')
         )
         
@@ -467,38 +729,17 @@ Votre assistant de recherche d'emploi
         self.db.update_job_status(job_data.get('job_id'), 'rejected', {
             'rejection_date': datetime.now().strftime('%Y-%m-%d'),
             'rejection_reason': 'Received rejection email',
-            'rejection_details': email_data.get('body', '')[:1000]
+            'rejection_details': self._body_preview(email_data, 1000)
         })
         
         # Notify the user about the rejection
         user_email = self.config['email'].get('from_email')
         subject = f"Mise à jour de candidature : Refus - {job_data.get('title', '')}"
         
-        message = f"""Bonjour,
-
-Nous avons reçu une mise à jour concernant votre candidature pour le poste de {job_title} chez {company}.
-
-Statut : ❌ Non retenu(e)
-
-Message reçu :
-{email_body}
-
----
-
-Voici une suggestion de réponse de remerciement que vous pouvez utiliser :
-
-{suggested_response}
-
----
-
-Nous continuons à surveiller d'autres opportunités pour vous.
-
-Cordialement,
-Votre assistant de recherche d'emploi
-""".format(
+        message = _REJECTION_TEMPLATE.format(
             job_title=job_data.get('title', ''),
             company=job_data.get('company', ''),
-            email_body=email_data.get('body', '')[:500] + '...' if email_data.get('body') else '',
+            email_body=self._body_preview(email_data, 500) + '...' if email_data.get('body') else '',
             suggested_response=analysis.get('suggested_response', '')
         )
         
@@ -525,34 +766,11 @@ Votre assistant de recherche d'emploi
         user_email = self.config['email'].get('from_email')
         subject = f"Réponse inattendue concernant votre candidature - {job_data.get('title', '')}"
         
-        message = f"""Bonjour,
-
-Nous avons reçu une réponse concernant votre candidature pour le poste de {job_title} chez {company}, mais nous n'avons pas pu déterminer automatiquement la meilleure façon de la traiter.
-
-Détails de la candidature :
-- Poste : {job_title}
-- Entreprise : {company}
-- Date de candidature : {applied_date}
-
-Message reçu :
-{email_body}
-
----
-
-Notre analyse indique :
-{analysis}
-
----
-
-Veuillez examiner ce message et prendre les mesures appropriées.
-
-Cordialement,
-Votre assistant de recherche d'emploi
-""".format(
+        message = _UNKNOWN_RESPONSE_TEMPLATE.format(
             job_title=job_data.get('title', ''),
             company=job_data.get('company', ''),
             applied_date=job_data.get('applied_date', ''),
-            email_body=email_data.get('body', '')[:500] + '...' if email_data.get('body') else '',
+            email_body=self._body_preview(email_data, 500) + '...' if email_data.get('body') else '',
             analysis='\n'.join([f"- {k}: {v}" for k, v in analysis.items()])
         )
         
@@ -8,7 +8,7 @@ from smart_timing import SmartTiming
 from profile_optimizer import ProfileOptimizer
 from salary_advisor import SalaryAdvisor
 from career_planner import CareerPlanner
-from job_database import JobDatabase
+from job_database import JobDatabase, JOB_COLUMNS
 from config import PROFILE
 
 print("=" * 80)
@@ -16,7 +16,7 @@ print("JOB HUNTER BOT - COMPLETE FEATURE TEST SUITE")
 print("=" * 80)
 
 db = JobDatabase()
-jobs = db.get_new_jobs()
+jobs = db.get_new_jobs(JOB_COLUMNS)
 
 if not jobs:
     print("\n❌ No jobs in database. Run add_sample_jobs.py first!")
@@ -26,6 +26,7 @@ def run_job_search():
     
     logging.info("Starting scheduled job search")
     
+    hunter = None
     try:
         hunter = JobHunter()
         jobs = hunter.run_search(headless=True)
@@ -42,10 +43,20 @@ def run_job_search():
     except Exception as e:
         logging.error(f"Job search error: {e}")
         print(f"❌ Error: {e}")
+    finally:
+        # Every run builds its own JobHunter; don't leave its browsers behind
+        if hunter:
+            hunter.close()
+
+
+# One hunter for every email check, so its IMAP session is reused between
+# checks (closed when the scheduler stops)
+_response_hunter = None
 
 
 def check_responses_job():
     """Check for email responses"""
+    global _response_hunter
     print(f"\n{'='*60}")
     print(f"📧 Checking Email Responses - {datetime.now().strftime('%Y-%m-%d %H:%M')}")
     print(f"{'='*60}")
@@ -53,8 +64,9 @@ def check_responses_job():
     logging.info("Starting email response check")
     
     try:
-        hunter = JobHunter()
-        hunter.check_responses()
+        if _response_hunter is None:
+            _response_hunter = JobHunter()
+        _response_hunter.check_responses()
         logging.info("Email check completed")
         
     except Exception as e:
@@ -70,6 +82,7 @@ def auto_apply_job():
     
     logging.info("Starting auto-apply job")
     
+    hunter = None
     try:
         hunter = JobHunter()
         hunter.auto_apply(max_applications=10)
@@ -78,6 +91,26 @@ def auto_apply_job():
     except Exception as e:
         logging.error(f"Auto-apply error: {e}")
         print(f"❌ Error: {e}")
+    finally:
+        if hunter:
+            hunter.close()
+
+
+def process_queue_job():
+    """Submit (or enqueue for RQ workers) applications whose optimal time has come"""
+    logging.info("Processing queued applications")
+    
+    hunter = None
+    try:
+        hunter = JobHunter()
+        hunter.process_queued_applications()
+        
+    except Exception as e:
+        logging.error(f"Queued applications error: {e}")
+        print(f"❌ Error: {e}")
+    finally:
+        if hunter:
+            hunter.close()
 
 
 def run_scheduler():
@@ -89,6 +122,7 @@ def run_scheduler():
     print("  📋 Job Search: Every day at 9:00 AM and 6:00 PM")
     print("  📧 Email Check: Every 2 hours")
     print("  🤖 Auto-Apply: Every 4 hours (if enabled)")
+    print("  ⏰ Queued Applications: Every 15 minutes (if auto-apply enabled)")
     print("\nPress Ctrl+C to stop")
     print("="*60 + "\n")
     
@@ -102,6 +136,7 @@ def run_scheduler():
     # Schedule auto-apply (every 4 hours, if enabled)
     if APPLICATION.get('auto_apply'):
         schedule.every(4).hours.do(auto_apply_job)
+        schedule.every(15).minutes.do(process_queue_job)
         print("✅ Auto-apply is ENABLED")
     else:
         print("⚠️  Auto-apply is DISABLED")
@@ -110,9 +145,13 @@ def run_scheduler():
     run_job_search()
     
     # Keep running
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
+    try:
+        while True:
+            schedule.run_pending()
+            time.sleep(60)  # Check every minute
+    finally:
+        if _response_hunter:
+            _response_hunter.close()
 
 
 if __name__ == "__main__":
@@ -10,7 +10,7 @@ import json
 from datetime import datetime
 import os
 
-from job_database import JobDatabase
+from job_database import JobDatabase, JOB_COLUMNS
 from job_matcher import JobMatcher
 from indeed_bot import IndeedBot
 
@@ -117,9 +117,9 @@ def get_jobs():
     source_filter = request.args.get('source')
     
     if source_filter:
-        jobs = db.get_jobs_by_source(source_filter)
+        jobs = db.get_jobs_by_source(source_filter, JOB_COLUMNS)
     else:
-        jobs = db.get_new_jobs() if status_filter == 'new' else []
+        jobs = db.get_new_jobs(JOB_COLUMNS) if status_filter == 'new' else []
     
     return jsonify(jobs)
 
@@ -10,7 +10,7 @@ import os
 import hashlib
 import json
 from datetime import datetime, timedelta
-from job_database import JobDatabase
+from job_database import JobDatabase, JOB_COLUMNS
 from profile_optimizer import ProfileOptimizer
 from cover_letter_generator import CoverLetterGenerator
 from interview_prep import InterviewPrep
@@ -117,7 +117,7 @@ def logout():
 @login_required
 def dashboard():
     stats = db.get_stats()
-    jobs = db.get_new_jobs()
+    jobs = db.get_new_jobs(JOB_COLUMNS)
     
     # Get profile analysis
     profile_analysis = None
@@ -133,7 +133,7 @@ def dashboard():
 @app.route('/jobs')
 @login_required
 def jobs():
-    all_jobs = db.get_new_jobs()
+    all_jobs = db.get_new_jobs(JOB_COLUMNS)
     return render_template('jobs.html', jobs=all_jobs, user=session)
 
 @app.route('/job/<job_id>')
@@ -159,7 +159,7 @@ def job_detail(job_id):
 @app.route('/profile')
 @login_required
 def profile():
-    jobs = db.get_new_jobs()
+    jobs = db.get_new_jobs(JOB_COLUMNS)
     analysis = None
     
     if jobs:
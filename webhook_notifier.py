@@ -4,9 +4,14 @@ Webhook Notifier - Send real-time notifications to Slack, Discord, or Telegram
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional
 from datetime import datetime
 
+# Jobs per batched message (Discord caps a message at 10 embeds)
+BATCH_SIZES = {'slack': 20, 'discord': 10, 'telegram': 10}
+
 
 class WebhookNotifier:
     """Send notifications to various platforms via webhooks"""
@@ -21,6 +26,23 @@ class WebhookNotifier:
         """
         self.webhook_url = webhook_url
         self.platform = platform.lower()
+        
+        # One keep-alive session for every notification. POST is retried only
+        # when the message cannot have been delivered: connect errors, 429
+        # and 503 (never on read errors or 502/504, which could double-post)
+        self.session = requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json'})
+        adapter = HTTPAdapter(
+            max_retries=Retry(
+                total=3,
+                read=False,
+                backoff_factor=0.5,
+                status_forcelist=[429, 503],
+                allowed_methods=frozenset(['POST'])
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def notify_new_job(self, job: Dict):
         """
@@ -42,6 +64,30 @@ class WebhookNotifier:
         elif self.platform == 'telegram':
             self._send_telegram_new_job(job)
     
+    def notify_new_jobs(self, jobs: List[Dict]):
+        """
+        Send high-match jobs as a few batched messages instead of one per job
+        
+        Args:
+            jobs: Job dictionaries; those under 70% match are skipped
+        """
+        high_match = [job for job in jobs if job.get('match_score', 0) >= 70]
+        if not high_match:
+            return
+        
+        if self.platform == 'slack':
+            send = self._send_slack_new_jobs
+        elif self.platform == 'discord':
+            send = self._send_discord_new_jobs
+        elif self.platform == 'telegram':
+            send = self._send_telegram_new_jobs
+        else:
+            return
+        
+        size = BATCH_SIZES[self.platform]
+        for start in range(0, len(high_match), size):
+            send(high_match[start:start + size])
+    
     def notify_application_submitted(self, job: Dict):
         """
         Send notification when application is submitted
@@ -87,36 +133,49 @@ class WebhookNotifier:
             self._send_telegram_complex_question(job, questions)
     
     # Slack implementations
-    def _send_slack_new_job(self, job: Dict):
-        """Send Slack notification for new job"""
+    def _slack_job_attachment(self, job: Dict) -> Dict:
+        """Build the Slack attachment describing one job"""
         match_score = job.get('match_score', 0)
         color = 'good' if match_score >= 80 else 'warning'
         
-        message = {
-            'text': '🎯 High Match Job Found!',
-            'attachments': [{
-                'color': color,
-                'fields': [
-                    {'title': 'Position', 'value': job.get('title', 'N/A'), 'short': False},
-                    {'title': 'Company', 'value': job.get('company', 'N/A'), 'short': True},
-                    {'title': 'Location', 'value': job.get('location', 'N/A'), 'short': True},
-                    {'title': 'Match Score', 'value': f"{match_score}%", 'short': True},
-                    {'title': 'Salary', 'value': job.get('salary', 'Not specified'), 'short': True},
-                    {'title': 'Source', 'value': job.get('source', 'N/A').upper(), 'short': True},
-                    {'title': 'Easy Apply', 'value': '✅ Yes' if job.get('easy_apply') else '❌ No', 'short': True},
-                ],
-                'footer': 'Job Hunter Bot',
-                'ts': int(datetime.now().timestamp())
-            }]
+        attachment = {
+            'color': color,
+            'fields': [
+                {'title': 'Position', 'value': job.get('title', 'N/A'), 'short': False},
+                {'title': 'Company', 'value': job.get('company', 'N/A'), 'short': True},
+                {'title': 'Location', 'value': job.get('location', 'N/A'), 'short': True},
+                {'title': 'Match Score', 'value': f"{match_score}%", 'short': True},
+                {'title': 'Salary', 'value': job.get('salary', 'Not specified'), 'short': True},
+                {'title': 'Source', 'value': job.get('source', 'N/A').upper(), 'short': True},
+                {'title': 'Easy Apply', 'value': '✅ Yes' if job.get('easy_apply') else '❌ No', 'short': True},
+            ],
+            'footer': 'Job Hunter Bot',
+            'ts': int(datetime.now().timestamp())
         }
         
         if job.get('url'):
-            message['attachments'][0]['actions'] = [{
+            attachment['actions'] = [{
                 'type': 'button',
                 'text': 'View Job',
                 'url': job['url']
             }]
         
+        return attachment
+    
+    def _send_slack_new_job(self, job: Dict):
+        """Send Slack notification for new job"""
+        message = {
+            'text': '🎯 High Match Job Found!',
+            'attachments': [self._slack_job_attachment(job)]
+        }
+        self._send_webhook(message)
+    
+    def _send_slack_new_jobs(self, jobs: List[Dict]):
+        """Send one Slack message listing several new jobs"""
+        message = {
+            'text': f'🎯 {len(jobs)} High Match Jobs Found!',
+            'attachments': [self._slack_job_attachment(job) for job in jobs]
+        }
         self._send_webhook(message)
     
     def _send_slack_application(self, job: Dict):
@@ -194,8 +253,8 @@ class WebhookNotifier:
         self._send_webhook(message)
     
     # Discord implementations
-    def _send_discord_new_job(self, job: Dict):
-        """Send Discord notification for new job"""
+    def _discord_job_embed(self, job: Dict) -> Dict:
+        """Build the Discord embed describing one job"""
         match_score = job.get('match_score', 0)
         color = 0x00FF00 if match_score >= 80 else 0xFFA500  # Green or Orange
         
@@ -217,8 +276,15 @@ class WebhookNotifier:
         if job.get('url'):
             embed['url'] = job['url']
         
-        message = {'embeds': [embed]}
-        self._send_webhook(message)
+        return embed
+    
+    def _send_discord_new_job(self, job: Dict):
+        """Send Discord notification for new job"""
+        self._send_webhook({'embeds': [self._discord_job_embed(job)]})
+    
+    def _send_discord_new_jobs(self, jobs: List[Dict]):
+        """Send one Discord message carrying an embed per job"""
+        self._send_webhook({'embeds': [self._discord_job_embed(job) for job in jobs]})
     
     def _send_discord_application(self, job: Dict):
         """Send Discord notification for application"""
@@ -268,13 +334,11 @@ class WebhookNotifier:
         self._send_webhook({'embeds': [embed]})
     
     # Telegram implementations
-    def _send_telegram_new_job(self, job: Dict):
-        """Send Telegram notification for new job"""
+    def _telegram_job_text(self, job: Dict) -> str:
+        """Build the Markdown block describing one job"""
         match_score = job.get('match_score', 0)
         
         text = f"""
-🎯 *High Match Job Found!*
-
 *Position:* {job.get('title', 'N/A')}
 *Company:* {job.get('company', 'N/A')}
 *Location:* {job.get('location', 'N/A')}
@@ -287,12 +351,22 @@ class WebhookNotifier:
         if job.get('url'):
             text += f"\n[View Job]({job['url']})"
         
+        return text
+    
+    def _send_telegram_new_job(self, job: Dict):
+        """Send Telegram notification for new job"""
         message = {
-            'text': text,
+            'text': "\n🎯 *High Match Job Found!*\n" + self._telegram_job_text(job),
             'parse_mode': 'Markdown'
         }
         self._send_webhook(message)
     
+    def _send_telegram_new_jobs(self, jobs: List[Dict]):
+        """Send one Telegram message listing several new jobs"""
+        text = f"\n🎯 *{len(jobs)} High Match Jobs Found!*\n"
+        text += "\n".join(self._telegram_job_text(job) for job in jobs)
+        self._send_webhook({'text': text, 'parse_mode': 'Markdown'})
+    
     def _send_telegram_application(self, job: Dict):
         """Send Telegram notification for application"""
         text = f"""
@@ -352,15 +426,18 @@ class WebhookNotifier:
             payload: Message payload
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.webhook_url,
                 json=payload,
-                headers={'Content-Type': 'application/json'},
                 timeout=10
             )
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             print(f"Webhook notification failed: {e}")
+    
+    def close(self):
+        """Close the pooled HTTP session"""
+        self.session.close()
 
 
 # Example usage